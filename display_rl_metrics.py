@@ -67,7 +67,7 @@ def display_rl_metrics(model_name: str = None):
     
     # Préparer les données pour le calcul des métriques
     model_data = {
-        'states': len(agent.q_table),
+        'states': agent.states_learned,
         'epsilon': agent.epsilon,
         'metadata': metadata
     }
@@ -212,7 +212,7 @@ def compare_top_models(top_n: int = 5):
         if success:
             metadata = model_info.get('metadata', {})
             model_data = {
-                'states': len(agent.q_table),
+                'states': agent.states_learned,
                 'epsilon': agent.epsilon,
                 'metadata': metadata
             }
@@ -3,6 +3,9 @@ Module Engine - Logique pure du jeu de Morpion
 Contient uniquement les règles du jeu, indépendant de l'IA et de l'interface.
 """
 
-from .environment import TicTacToeEnvironment
+from .environment import (
+    TicTacToeEnvironment, BatchedTicTacToeEnv, state_to_index, index_to_board, NUM_STATES
+)
 
-__all__ = ['TicTacToeEnvironment']
+__all__ = ['TicTacToeEnvironment', 'BatchedTicTacToeEnv', 'state_to_index', 'index_to_board',
+           'NUM_STATES']
@@ -6,6 +6,14 @@ PURE GAME LOGIC - Aucune dépendance IA ou GUI.
 
 import numpy as np
 from typing import Tuple, List, Optional
+from .lookup_tables import (
+    NUM_CELLS, NUM_STATES, POW3, EMPTY_BOARD_INDEX, ONGOING, WINNER_DRAW,
+    WINNER_LUT, LEGAL_MASK_LUT, LEGAL_ACTIONS_LUT,
+    state_to_index, index_to_board
+)
+
+# Puissances de 3 sous forme de tableau (mises à jour d'index par lot)
+_POW3_ARRAY = np.array(POW3, dtype=np.int64)
 
 
 class TicTacToeEnvironment:
@@ -22,8 +30,10 @@ class TicTacToeEnvironment:
     
     def __init__(self):
         """Initialise l'environnement"""
-        self.board = None
+        # Plateau alloué une seule fois, remis à zéro sur place par reset()
+        self.board = np.zeros((self.GRID_SIZE, self.GRID_SIZE), dtype=np.int8)
         self.current_player = None
+        self.state_index = EMPTY_BOARD_INDEX  # Plateau encodé (voir lookup_tables)
         self.reset()
     
     def reset(self) -> Tuple:
@@ -33,8 +43,9 @@ class TicTacToeEnvironment:
         Returns:
             État initial du jeu (tuple hashable)
         """
-        self.board = np.zeros((self.GRID_SIZE, self.GRID_SIZE), dtype=int)
+        self.board.fill(self.EMPTY)
         self.current_player = self.PLAYER_X
+        self.state_index = EMPTY_BOARD_INDEX
         return self.get_state()
     
     def get_state(self) -> Tuple:
@@ -45,7 +56,7 @@ class TicTacToeEnvironment:
         Returns:
             Tuple représentant l'état actuel
         """
-        return (tuple(self.board.flatten()), self.current_player)
+        return (tuple(self.board.ravel().tolist()), self.current_player)
     
     def legal_actions(self, state: Optional[Tuple] = None) -> List[int]:
         """
@@ -58,13 +69,8 @@ class TicTacToeEnvironment:
         Returns:
             Liste des indices des cases vides
         """
-        if state is None:
-            board = self.board
-        else:
-            board = np.array(state[0]).reshape(self.GRID_SIZE, self.GRID_SIZE)
-        
-        return [i for i in range(self.GRID_SIZE * self.GRID_SIZE) 
-                if board.flat[i] == self.EMPTY]
+        index = self.state_index if state is None else state_to_index(state[0])
+        return list(LEGAL_ACTIONS_LUT[index])
     
     def apply_action(self, action: int) -> Tuple[Tuple, float, bool]:
         """
@@ -81,17 +87,18 @@ class TicTacToeEnvironment:
         Raises:
             ValueError: Si l'action est illégale
         """
-        if action not in self.legal_actions():
+        if not (0 <= action < NUM_CELLS and LEGAL_MASK_LUT[self.state_index] >> action & 1):
             raise ValueError(f"Action illégale: {action}. Cases disponibles: {self.legal_actions()}")
         
-        # Jouer le coup
+        # Jouer le coup (la case passe de 0 à current_player : l'index varie de current_player * 3^action)
         row, col = action // self.GRID_SIZE, action % self.GRID_SIZE
         self.board[row, col] = self.current_player
+        self.state_index += self.current_player * POW3[action]
         player_who_played = self.current_player
         
-        # Vérifier la fin de partie
+        # Vérifier la fin de partie (lecture de table)
         winner = self._check_winner()
-        done = winner is not None or len(self.legal_actions()) == 0
+        done = WINNER_LUT[self.state_index] != ONGOING
         
         # Calculer la récompense (du point de vue du joueur qui vient de jouer)
         if winner == player_who_played:
@@ -116,24 +123,9 @@ class TicTacToeEnvironment:
         Returns:
             PLAYER_X (1) ou PLAYER_O (-1) si victoire, None sinon
         """
-        # Vérifier les lignes
-        for row in range(self.GRID_SIZE):
-            if abs(sum(self.board[row, :])) == self.GRID_SIZE:
-                return self.board[row, 0]
-        
-        # Vérifier les colonnes
-        for col in range(self.GRID_SIZE):
-            if abs(sum(self.board[:, col])) == self.GRID_SIZE:
-                return self.board[0, col]
-        
-        # Vérifier la diagonale principale
-        if abs(sum(self.board.diagonal())) == self.GRID_SIZE:
-            return self.board[0, 0]
-        
-        # Vérifier la diagonale secondaire
-        if abs(sum(np.fliplr(self.board).diagonal())) == self.GRID_SIZE:
-            return self.board[0, self.GRID_SIZE - 1]
-        
+        winner = WINNER_LUT[self.state_index]
+        if winner == self.PLAYER_X or winner == self.PLAYER_O:
+            return int(winner)
         return None
     
     def is_terminal(self) -> bool:
@@ -143,7 +135,7 @@ class TicTacToeEnvironment:
         Returns:
             True si la partie est terminée
         """
-        return self._check_winner() is not None or len(self.legal_actions()) == 0
+        return WINNER_LUT[self.state_index] != ONGOING
     
     def get_winner(self) -> Optional[int]:
         """
@@ -171,8 +163,9 @@ class TicTacToeEnvironment:
             state: État à restaurer (tuple)
         """
         board_flat, current_player = state
-        self.board = np.array(board_flat).reshape(self.GRID_SIZE, self.GRID_SIZE)
+        self.board[:] = np.reshape(board_flat, (self.GRID_SIZE, self.GRID_SIZE))
         self.current_player = current_player
+        self.state_index = state_to_index(board_flat)
     
     def render(self):
         """Affiche le plateau dans la console (pour débogage)"""
@@ -209,3 +202,100 @@ class TicTacToeEnvironment:
             Tuple (ligne, colonne)
         """
         return action // self.GRID_SIZE, action % self.GRID_SIZE
+
+
+class BatchedTicTacToeEnv:
+    """
+    N parties de Morpion jouées en parallèle, au même rythme (à la manière
+    d'un SyncVectorEnv) : chaque pas joue un coup dans toutes les parties
+    encore en cours. Les plateaux tiennent dans un seul tableau int8 (N, 9)
+    et les index base 3 (voir lookup_tables) sont tenus à jour par lot.
+    """
+    
+    def __init__(self, batch_size: int = 200):
+        """
+        Initialise l'environnement vectorisé.
+        
+        Args:
+            batch_size: Nombre de parties jouées simultanément
+        """
+        self.batch_size = batch_size
+        self.boards = np.zeros((batch_size, NUM_CELLS), dtype=np.int8)
+        self.state_indices = np.full(batch_size, EMPTY_BOARD_INDEX, dtype=np.int64)
+        self.dones = np.zeros(batch_size, dtype=bool)
+        self.num_moves = np.zeros(batch_size, dtype=np.int8)
+        self.current_player = TicTacToeEnvironment.PLAYER_X
+        self.reset()
+    
+    def reset(self) -> np.ndarray:
+        """
+        Réinitialise toutes les parties.
+        
+        Returns:
+            Index base 3 des plateaux (N,)
+        """
+        self.boards.fill(0)
+        self.state_indices.fill(EMPTY_BOARD_INDEX)
+        self.dones.fill(False)
+        self.num_moves.fill(0)
+        self.current_player = TicTacToeEnvironment.PLAYER_X
+        return self.state_indices.copy()
+    
+    def legal_masks(self) -> np.ndarray:
+        """
+        Retourne les masques des actions légales (cases vides).
+        
+        Returns:
+            Tableau booléen (N, 9)
+        """
+        return self.boards == TicTacToeEnvironment.EMPTY
+    
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Joue une action dans chaque partie en cours (ignorée pour les parties terminées).
+        
+        Args:
+            actions: Indices des cases (N,)
+        
+        Returns:
+            obs: Index base 3 des plateaux (N,)
+            rewards: Récompenses du joueur qui vient de jouer (mêmes valeurs
+                que TicTacToeEnvironment.apply_action, 0 pour les parties terminées)
+            dones: True pour les parties terminées
+        
+        Raises:
+            ValueError: Si une action est illégale dans une partie en cours
+        """
+        lanes = np.flatnonzero(~self.dones)
+        played = np.asarray(actions)[lanes]
+        if ((played < 0) | (played >= NUM_CELLS)).any() or \
+                self.boards[lanes, played % NUM_CELLS].any():
+            raise ValueError("Action illégale dans au moins une partie")
+        
+        player = self.current_player
+        self.boards[lanes, played] = player
+        self.state_indices[lanes] += player * _POW3_ARRAY[played]
+        self.num_moves[lanes] += 1
+        
+        # Fin de partie lue dans la table, uniquement pour les parties actives
+        winners = WINNER_LUT[self.state_indices[lanes]]
+        finished = winners != ONGOING
+        rewards = np.zeros(self.batch_size, dtype=np.float32)
+        rewards[lanes[winners == player]] = 1.0
+        rewards[lanes[winners == WINNER_DRAW]] = 0.5
+        self.dones[lanes[finished]] = True
+        
+        # Toutes les parties avancent au même rythme : un seul joueur au trait
+        self.current_player = -player
+        
+        return self.state_indices.copy(), rewards, self.dones.copy()
+    
+    def get_winners(self) -> np.ndarray:
+        """
+        Retourne le gagnant de chaque partie.
+        
+        Returns:
+            Tableau int8 (N,) : 1 (X), -1 (O) ou 0 (nul/partie en cours)
+        """
+        winners = WINNER_LUT[self.state_indices]
+        return np.where(winners == ONGOING, 0, winners).astype(np.int8)
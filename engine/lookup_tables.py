@@ -0,0 +1,138 @@
+"""
+Encodage base 3 et tables précalculées du Morpion 3x3
+Pour chacun des 3^9 plateaux encodés (voir state_to_index), stocke le
+gagnant et le masque des cases vides. Construites une seule fois à l'import
+par NumPy vectorisé : une lecture de tableau remplace la vérification des
+8 lignes gagnantes à chaque coup.
+"""
+
+import numpy as np
+from typing import List, Tuple, Sequence
+
+
+# Encodage compact des plateaux 3x3 : chaque case vaut -1/0/1, soit 3 valeurs
+# possibles, donc 3^9 plateaux au total (superset des états atteignables).
+NUM_CELLS = 9
+NUM_STATES = 3 ** NUM_CELLS
+POW3 = tuple(3 ** i for i in range(NUM_CELLS))
+
+
+def state_to_index(board: Sequence[int]) -> int:
+    """
+    Encode un plateau aplati en entier base 3 (index dans une Q-table dense).
+    
+    Args:
+        board: 9 valeurs parmi -1 (O), 0 (vide), 1 (X)
+    
+    Returns:
+        Index dans [0, 3^9)
+    """
+    return sum((int(value) + 1) * power for value, power in zip(board, POW3))
+
+
+def index_to_board(index: int) -> Tuple[int, ...]:
+    """
+    Décode un index base 3 en plateau aplati (inverse de state_to_index).
+    
+    Args:
+        index: Index dans [0, 3^9)
+    
+    Returns:
+        Tuple de 9 valeurs parmi -1, 0, 1
+    """
+    board = []
+    for _ in range(NUM_CELLS):
+        index, digit = divmod(index, 3)
+        board.append(digit - 1)
+    return tuple(board)
+
+
+# Les 8 lignes gagnantes (indices du plateau aplati)
+WIN_LINES = np.array([
+    [0, 1, 2], [3, 4, 5], [6, 7, 8],  # Lignes
+    [0, 3, 6], [1, 4, 7], [2, 5, 8],  # Colonnes
+    [0, 4, 8], [2, 4, 6]              # Diagonales
+], dtype=np.int64)
+
+# Les mêmes lignes en bitboard 9 bits (bit i = case i) : un joueur gagne si
+# (bb & LINE_MASKS[k]) == LINE_MASKS[k] pour une des lignes k
+LINE_MASKS = np.array([(1 << a) | (1 << b) | (1 << c) for a, b, c in WIN_LINES.tolist()],
+                      dtype=np.uint16)
+FULL_MASK = (1 << NUM_CELLS) - 1
+
+# Codes de WINNER_LUT
+WINNER_O = -1
+WINNER_DRAW = 0
+WINNER_X = 1
+ONGOING = 2
+
+# Index du plateau vide (toutes les cases valent 0, soit le chiffre 1)
+EMPTY_BOARD_INDEX = sum(POW3)
+
+
+def _build_tables() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Énumère les 3^9 plateaux et calcule gagnant + cases vides (via bitboards)"""
+    indices = np.arange(NUM_STATES)
+    boards = ((indices[:, None] // np.array(POW3)) % 3 - 1).astype(np.int8)
+
+    # Bitboards des deux joueurs, puis test des 8 lignes sans boucle par ligne
+    bits = np.left_shift(1, np.arange(NUM_CELLS)).astype(np.uint16)
+    bb_x = ((boards == 1) * bits).sum(axis=1).astype(np.uint16)
+    bb_o = ((boards == -1) * bits).sum(axis=1).astype(np.uint16)
+    x_wins = ((bb_x[:, None] & LINE_MASKS) == LINE_MASKS).any(axis=1)
+    o_wins = ((bb_o[:, None] & LINE_MASKS) == LINE_MASKS).any(axis=1)
+    occupied = bb_x | bb_o
+
+    winner = np.full(NUM_STATES, ONGOING, dtype=np.int8)
+    winner[occupied == FULL_MASK] = WINNER_DRAW
+    winner[o_wins] = WINNER_O
+    winner[x_wins] = WINNER_X  # Plateaux doublement gagnants: inatteignables
+
+    legal_mask = (~occupied & FULL_MASK).astype(np.uint16)
+
+    return boards, winner, legal_mask
+
+
+BOARD_LUT, WINNER_LUT, LEGAL_MASK_LUT = _build_tables()
+
+# Actions légales par état, sous forme de tuples prêts à l'emploi
+LEGAL_ACTIONS_LUT: List[Tuple[int, ...]] = [
+    tuple(i for i in range(NUM_CELLS) if mask >> i & 1)
+    for mask in LEGAL_MASK_LUT.tolist()
+]
+
+
+def _build_symmetries() -> Tuple[np.ndarray, np.ndarray]:
+    """Permutations des cases pour les 8 symétries du carré (4 rotations x miroir)"""
+    grid = np.arange(NUM_CELLS).reshape(3, 3)
+    perms = np.array([np.rot90(g, k).ravel() for g in (grid, grid.T) for k in range(4)],
+                     dtype=np.int64)
+    # La case a du plateau d'origine se retrouve en position inverse[a]
+    return perms, np.argsort(perms, axis=1)
+
+
+# SYMMETRY_PERMS[k, i] : case d'origine lue en position i par la symétrie k
+# SYMMETRY_ACTIONS[k, a] : image de l'action a par la symétrie k
+SYMMETRY_PERMS, SYMMETRY_ACTIONS = _build_symmetries()
+
+_POW3_ARRAY = np.array(POW3, dtype=np.int64)
+
+
+def symmetric_indices(index: int) -> np.ndarray:
+    """
+    Index base 3 des 8 images d'un plateau par les symétries du carré.
+    
+    Args:
+        index: Index dans [0, 3^9)
+    
+    Returns:
+        Tableau (8,) aligné sur SYMMETRY_PERMS / SYMMETRY_ACTIONS
+    """
+    return (BOARD_LUT[index][SYMMETRY_PERMS] + 1) @ _POW3_ARRAY
+
+
+# Pour chaque masque 9 bits : nombre de bits à 1 et index du bit de poids
+# faible (-1 pour 0), pour parcourir les cases libres bit à bit
+_MASKS = np.arange(1 << NUM_CELLS)
+POPCOUNT_LUT = np.array([bin(m).count("1") for m in _MASKS.tolist()], dtype=np.int64)
+LOWEST_BIT_LUT = np.array([(m & -m).bit_length() - 1 for m in _MASKS.tolist()], dtype=np.int64)
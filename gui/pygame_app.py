@@ -60,7 +60,7 @@ class GameGUI:
         
         # Vues
         self.game_view = GameView(self.screen, self.assets)
-        self.game_view.set_agent(self.agent, "q_table.pkl")
+        self.game_view.set_agent(self.agent, self.model_manager.default_model.name)
         
         self.stats_view = StatsView(self.screen, self.assets, self.logger)
         self.stats_view.set_agent(self.agent)
@@ -254,7 +254,7 @@ class ModelsView:
         # Ouvrir le dialogue de fichier
         file_path = filedialog.askopenfilename(
             title="Sélectionner un modèle à importer",
-            filetypes=[("Modèles PKL", "*.pkl"), ("Tous les fichiers", "*.*")],
+            filetypes=[("Modèles", "*.npz *.pkl"), ("Tous les fichiers", "*.*")],
             initialdir="."
         )
         
@@ -277,6 +277,10 @@ class ModelsView:
             
             try:
                 shutil.copy2(file_path, dest_path)
+                # Fichier compagnon (.meta.json) importé avec le modèle
+                info_file = self.model_manager.info_path(file_path)
+                if info_file.exists():
+                    shutil.copy2(info_file, self.model_manager.info_path(dest_path))
                 print(f"✓ Modèle importé: {dest_path.name}")
                 self.refresh_models()
             except Exception as e:
@@ -319,7 +323,7 @@ class ModelsView:
         
         model = self.models[self.selected_model]
         old_path = Path(model['path'])
-        new_path = old_path.parent / f"{new_name}.pkl"
+        new_path = old_path.parent / f"{new_name}{old_path.suffix}"
         
         if new_path.exists():
             print(f"✗ Un modèle nommé '{new_name}' existe déjà")
@@ -327,6 +331,9 @@ class ModelsView:
         
         try:
             old_path.rename(new_path)
+            old_info = self.model_manager.info_path(old_path)
+            if old_info.exists():
+                old_info.rename(self.model_manager.info_path(new_path))
             print(f"✓ Modèle renommé: {new_name}")
             
             # Mettre à jour les métadonnées
@@ -364,6 +371,7 @@ class ModelsView:
         if confirm:
             try:
                 Path(model['path']).unlink()
+                self.model_manager.info_path(model['path']).unlink(missing_ok=True)
                 
                 # Supprimer des métadonnées
                 if model['path'] in self.model_manager.metadata:
@@ -1084,7 +1092,23 @@ class ModelsView:
         return None
     
     def _calculate_model_metrics(self, model: Dict) -> Optional[Dict]:
-        """Calcule les métriques avancées pour un modèle"""
+        """
+        Métriques avancées d'un modèle, calculées une fois par version du
+        fichier (le tri et le panneau de détails les redemandent souvent)
+        """
+        from rl_logic.metrics import ModelMetrics
+        
+        mtime = model.get('mtime')
+        if mtime is None:
+            try:
+                mtime = os.path.getmtime(model['path'])
+            except OSError:
+                return self._compute_model_metrics(model)
+        return ModelMetrics.cached_metrics(model['path'], mtime,
+                                           lambda: self._compute_model_metrics(model))
+    
+    def _compute_model_metrics(self, model: Dict) -> Optional[Dict]:
+        """Calcule les métriques avancées pour un modèle (charge sa Q-table)"""
         try:
             from rl_logic.metrics import ModelMetrics
             from rl_logic.agent import QLearningAgent
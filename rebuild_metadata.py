@@ -3,9 +3,9 @@ Script pour reconstruire le fichier models_metadata.json
 avec toutes les métadonnées complètes
 """
 
-import pickle
 import json
 from pathlib import Path
+from rl_logic.model_manager import ModelManager
 
 models_dir = Path("models")
 metadata_file = models_dir / "models_metadata.json"
@@ -15,19 +15,18 @@ print("🔄 Reconstruction des métadonnées...\n")
 new_metadata = {}
 count = 0
 
-# Parcourir tous les fichiers .pkl
-for pkl_file in models_dir.glob("*.pkl"):
+# Parcourir tous les fichiers de modèles (.npz et anciens .pkl)
+for model_file in ModelManager(str(models_dir)).model_files():
     try:
-        # Charger le modèle
-        with open(pkl_file, 'rb') as f:
-            model_data = pickle.load(f)
+        # Charger les infos du modèle (sans la Q-table)
+        model_data = ModelManager.load_model_info(model_file)
         
         # Extraire les infos
         stats = model_data.get('stats', {})
         metadata = model_data.get('metadata', {})
         
         # Créer l'entrée de métadonnées
-        filepath = str(pkl_file)
+        filepath = str(model_file)
         new_metadata[filepath] = {
             'timestamp': model_data.get('timestamp', 'N/A'),
             'states': stats.get('total_states', 0),
@@ -44,13 +43,13 @@ for pkl_file in models_dir.glob("*.pkl"):
         
         # Afficher les modèles avec métriques complètes
         if metadata.get('final_win_rate', 0) > 0:
-            print(f"✅ {pkl_file.name}")
+            print(f"✅ {model_file.name}")
             print(f"   Win Rate: {metadata.get('final_win_rate', 0):.1f}%")
         else:
-            print(f"⚠️  {pkl_file.name} (ancien modèle)")
+            print(f"⚠️  {model_file.name} (ancien modèle)")
             
     except Exception as e:
-        print(f"❌ Erreur avec {pkl_file.name}: {e}")
+        print(f"❌ Erreur avec {model_file.name}: {e}")
 
 # Sauvegarder les nouvelles métadonnées
 with open(metadata_file, 'w') as f:
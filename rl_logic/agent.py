@@ -6,8 +6,42 @@ Agents d'apprentissage par renforcement
 
 import numpy as np
 import random
-from typing import Tuple, Dict, Optional, List
-from collections import defaultdict
+from typing import Tuple, Dict, Optional, List, Iterator
+from collections.abc import Mapping
+from engine.environment import NUM_STATES, state_to_index, index_to_board
+from engine.lookup_tables import (
+    BOARD_LUT, LEGAL_ACTIONS_LUT, SYMMETRY_ACTIONS, symmetric_indices
+)
+from .oracle import oracle_q_values
+
+
+class QTableView(Mapping):
+    """
+    Vue dictionnaire {état: {action: Q-valeur}} sur la Q-table dense.
+    Conserve l'interface historique (len, items, ...) sans dupliquer les données.
+    Seuls les états visités sont exposés, avec leurs actions légales.
+    """
+    
+    def __init__(self, agent: 'QLearningAgent'):
+        self._agent = agent
+    
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._agent.q_visited))
+    
+    def __iter__(self) -> Iterator[Tuple]:
+        for index in np.flatnonzero(self._agent.q_visited):
+            board = index_to_board(int(index))
+            # X commence : à égalité de pions, c'est à X de jouer
+            player = 1 if board.count(1) == board.count(-1) else -1
+            yield (board, player)
+    
+    def __getitem__(self, state: Tuple) -> Dict[int, float]:
+        index = state_to_index(state[0])
+        if not self._agent.q_visited[index]:
+            raise KeyError(state)
+        row = self._agent.q_values[index]
+        return {action: float(row[action]) 
+                for action, cell in enumerate(state[0]) if cell == 0}
 
 
 class QLearningAgent:
@@ -16,9 +50,15 @@ class QLearningAgent:
     Politique ε-greedy pour l'exploration/exploitation.
     """
     
+    # Attributs fixes : accès par slot, sans dictionnaire d'instance
+    __slots__ = ('alpha', 'gamma', 'epsilon', 'epsilon_start', 'epsilon_min',
+                 'epsilon_decay', 'rng', 'symmetric', 'q_values', 'q_visited')
+    
     def __init__(self, alpha: float = 0.2, gamma: float = 0.99, 
                  epsilon: float = 1.0, epsilon_min: float = 0.01, 
-                 epsilon_decay: float = 0.9995):
+                 epsilon_decay: float = 0.9995,
+                 rng: Optional[random.Random] = None,
+                 symmetric: bool = False, oracle_init: bool = False):
         """
         Initialise l'agent Q-Learning.
         
@@ -28,6 +68,11 @@ class QLearningAgent:
             epsilon: Taux d'exploration initial
             epsilon_min: Taux d'exploration minimal
             epsilon_decay: Facteur de décroissance de epsilon
+            rng: Générateur pour l'exploration et les égalités (nouveau si None)
+            symmetric: Partage chaque mise à jour entre les 8 plateaux
+                équivalents par rotation/miroir (convergence plus rapide)
+            oracle_init: Part de la Q-table optimale face à un adversaire
+                parfait (voir rl_logic.oracle) au lieu de zéros
         """
         self.alpha = alpha
         self.gamma = gamma
@@ -35,9 +80,25 @@ class QLearningAgent:
         self.epsilon_start = epsilon
         self.epsilon_min = epsilon_min
         self.epsilon_decay = epsilon_decay
+        self.rng = rng if rng is not None else random.Random()
+        self.symmetric = symmetric
         
-        # Q-table: {état: {action: Q-valeur}}
-        self.q_table: Dict[Tuple, Dict[int, float]] = defaultdict(lambda: defaultdict(float))
+        # Q-table dense: une ligne de 9 Q-valeurs par plateau encodé en base 3
+        if oracle_init:
+            self.q_values, self.q_visited = oracle_q_values(gamma)
+        else:
+            self.q_values = np.zeros((NUM_STATES, 9), dtype=np.float32)
+            self.q_visited = np.zeros(NUM_STATES, dtype=np.uint8)
+    
+    @property
+    def q_table(self) -> QTableView:
+        """Vue {état: {action: Q-valeur}} des états visités (lecture seule)"""
+        return QTableView(self)
+    
+    @property
+    def states_learned(self) -> int:
+        """Nombre d'états visités (équivalent de len(q_table), sans itération)"""
+        return int(np.count_nonzero(self.q_visited))
     
     def get_q_value(self, state: Tuple, action: int) -> float:
         """
@@ -50,7 +111,7 @@ class QLearningAgent:
         Returns:
             Q-valeur (0 si jamais visité)
         """
-        return self.q_table[state][action]
+        return float(self.q_values[state_to_index(state[0]), action])
     
     def get_max_q_value(self, state: Tuple, legal_actions: List[int]) -> float:
         """
@@ -65,7 +126,7 @@ class QLearningAgent:
         """
         if not legal_actions:
             return 0.0
-        return max(self.get_q_value(state, action) for action in legal_actions)
+        return float(self.q_values[state_to_index(state[0]), legal_actions].max())
     
     def get_best_action(self, state: Tuple, legal_actions: List[int]) -> int:
         """
@@ -85,18 +146,14 @@ class QLearningAgent:
         if not legal_actions:
             raise ValueError("Aucune action légale disponible")
         
-        # Obtenir toutes les Q-valeurs
-        q_values = [(action, self.get_q_value(state, action)) 
-                    for action in legal_actions]
-        
-        # Trouver la valeur maximale
-        max_q = max(q_values, key=lambda x: x[1])[1]
+        # Q-valeurs des actions légales (une seule lecture de ligne)
+        q_row = self.q_values[state_to_index(state[0]), legal_actions]
         
         # Obtenir toutes les actions avec la valeur maximale
-        best_actions = [action for action, q in q_values if q == max_q]
+        best_actions = [legal_actions[i] for i in np.flatnonzero(q_row == q_row.max())]
         
         # Choisir aléatoirement parmi les meilleures
-        return random.choice(best_actions)
+        return self.rng.choice(best_actions)
     
     def choose_action(self, state: Tuple, legal_actions: List[int], 
                      epsilon: Optional[float] = None) -> int:
@@ -118,14 +175,14 @@ class QLearningAgent:
             epsilon = self.epsilon
         
         # Exploration: action aléatoire
-        if random.random() < epsilon:
-            return random.choice(legal_actions)
+        if self.rng.random() < epsilon:
+            return self.rng.choice(legal_actions)
         
         # Exploitation: meilleure action
         return self.get_best_action(state, legal_actions)
     
     def update(self, state: Tuple, action: int, reward: float, 
-               next_state: Tuple, next_legal_actions: List[int], done: bool):
+               next_index: int, done: bool):
         """
         Met à jour la Q-table selon la formule de Q-learning:
         Q[s,a] = Q[s,a] + α * (reward + γ * max(Q[s',a']) - Q[s,a])
@@ -134,23 +191,41 @@ class QLearningAgent:
             state: État actuel
             action: Action prise
             reward: Récompense reçue
-            next_state: État suivant
-            next_legal_actions: Actions légales dans l'état suivant
+            next_index: Index base 3 de l'état suivant (env.state_index)
             done: True si l'épisode est terminé
         """
-        current_q = self.get_q_value(state, action)
+        q_values = self.q_values
+        index = state_to_index(state[0])
         
-        if done:
-            # État terminal: pas de valeur future
-            target = reward
-        else:
-            # Calcul du TD target
-            max_next_q = self.get_max_q_value(next_state, next_legal_actions)
-            target = reward + self.gamma * max_next_q
+        # État terminal: pas de valeur future
+        target = reward
+        if not done:
+            # Actions légales lues dans la table précalculée
+            target += self.gamma * float(
+                q_values[next_index, LEGAL_ACTIONS_LUT[next_index]].max())
         
-        # Mise à jour Q-learning
-        new_q = current_q + self.alpha * (target - current_q)
-        self.q_table[state][action] = new_q
+        q_values[index, action] += self.alpha * (target - q_values[index, action])
+        self.q_visited[index] = 1
+        
+        if self.symmetric:
+            # Même valeur pour les 8 couples (état, action) symétriques
+            images = symmetric_indices(index)
+            q_values[images, SYMMETRY_ACTIONS[:, action]] = q_values[index, action]
+            self.q_visited[images] = 1
+    
+    def get_policy_table(self) -> np.ndarray:
+        """
+        Précalcule la politique gloutonne sur les 3^9 plateaux (Q-table figée).
+        Seuls les états dont la meilleure action légale est unique sont
+        tabulés : les égalités restent départagées par le tirage habituel.
+        
+        Returns:
+            Tableau int8 (3^9,) : meilleure action, ou -1 (égalité, aucune case vide)
+        """
+        masked = np.where(BOARD_LUT == 0, self.q_values, -np.inf)
+        is_best = masked == masked.max(axis=1, keepdims=True)
+        unique = is_best.sum(axis=1) == 1
+        return np.where(unique, masked.argmax(axis=1), -1).astype(np.int8)
     
     def decay_epsilon(self):
         """Diminue le taux d'exploration selon epsilon_decay"""
@@ -176,17 +251,18 @@ class QLearningAgent:
         Returns:
             Dictionnaire avec les statistiques
         """
-        total_states = len(self.q_table)
-        total_state_actions = sum(len(actions) for actions in self.q_table.values())
+        visited = np.flatnonzero(self.q_visited)
+        total_states = len(visited)
         
-        all_q_values = [q for actions in self.q_table.values() 
-                       for q in actions.values()]
+        # Q-valeurs des cases vides des états visités
+        all_q_values = self.q_values[visited][BOARD_LUT[visited] == 0]
+        total_state_actions = len(all_q_values)
         
-        if all_q_values:
-            avg_q = np.mean(all_q_values)
-            max_q = np.max(all_q_values)
-            min_q = np.min(all_q_values)
-            std_q = np.std(all_q_values)
+        if total_state_actions:
+            avg_q = float(np.mean(all_q_values))
+            max_q = float(np.max(all_q_values))
+            min_q = float(np.min(all_q_values))
+            std_q = float(np.std(all_q_values))
         else:
             avg_q = max_q = min_q = std_q = 0.0
         
@@ -209,7 +285,7 @@ class QLearningAgent:
         Returns:
             Copie de la Q-table
         """
-        return {state: dict(actions) for state, actions in self.q_table.items()}
+        return {state: actions for state, actions in self.q_table.items()}
     
     def load_q_table(self, q_table_dict: Dict):
         """
@@ -218,18 +294,38 @@ class QLearningAgent:
         Args:
             q_table_dict: Dictionnaire représentant la Q-table
         """
-        self.q_table = defaultdict(lambda: defaultdict(float))
+        self.q_values.fill(0.0)
+        self.q_visited.fill(0)
         for state, actions in q_table_dict.items():
+            index = state_to_index(state[0])
+            self.q_visited[index] = 1
             for action, q_value in actions.items():
-                self.q_table[state][action] = q_value
+                self.q_values[index, action] = q_value
 
 
 class RandomAgent:
     """
     Agent qui joue aléatoirement.
     Utilisé comme baseline et adversaire d'entraînement.
+    Les tirages uniformes sont générés par blocs et consommés un par un.
     """
     
+    # Nombre de tirages uniformes générés à chaque recharge
+    POOL_SIZE = 65536
+    
+    __slots__ = ('rng', '_uniforms', '_cursor')
+    
+    def __init__(self, rng: Optional[np.random.Generator] = None):
+        """
+        Initialise l'agent aléatoire.
+        
+        Args:
+            rng: Générateur NumPy (nouveau générateur non seedé si None)
+        """
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self._uniforms: List[float] = []
+        self._cursor = 0
+    
     def choose_action(self, state: Tuple, legal_actions: List[int], 
                      epsilon: Optional[float] = None) -> int:
         """
@@ -243,7 +339,13 @@ class RandomAgent:
         Returns:
             Action aléatoire
         """
-        return random.choice(legal_actions)
+        if self._cursor == len(self._uniforms):
+            # Un seul appel au générateur pour POOL_SIZE coups
+            self._uniforms = self.rng.random(self.POOL_SIZE).tolist()
+            self._cursor = 0
+        u = self._uniforms[self._cursor]
+        self._cursor += 1
+        return legal_actions[int(u * len(legal_actions))]
     
     def update(self, *args, **kwargs):
         """Ne fait rien (l'agent aléatoire n'apprend pas)"""
@@ -4,9 +4,12 @@ Grid Search et Random Search pour Q-Learning
 """
 
 import time
+import traceback
 import itertools
 import random
-from typing import Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import csv
 from datetime import datetime
@@ -17,6 +20,41 @@ from .logger import RLLogger
 from .model_manager import ModelManager
 
 
+# Dossier des modèles et logs des configurations entraînées en parallèle
+AUTOML_OUTPUT_DIR = Path("models") / "automl"
+
+
+def _train_config_worker(task: Tuple) -> Dict:
+    """
+    Entraîne et évalue une configuration dans un processus worker
+    (fonction de module: picklable).
+    
+    Chaque worker a son propre environnement et écrit logs, modèles et
+    sortie console dans models/automl/config_<id>/ : les configurations
+    tournent en même temps et ne doivent pas réécrire les mêmes fichiers
+    de logs/ et models/.
+    
+    Args:
+        task: (config, num_episodes, eval_games, config_id)
+    
+    Returns:
+        Résultats détaillés (voir AutoMLTuner._train_and_evaluate)
+    """
+    config, num_episodes, eval_games, config_id = task
+    tuner = AutoMLTuner(TicTacToeEnvironment())
+    output_dir = AUTOML_OUTPUT_DIR / f"config_{config_id}"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # Les rapports du Trainer s'entremêleraient entre workers : un fichier par config
+    with open(output_dir / "output.log", 'w', encoding='utf-8') as output_file:
+        with redirect_stdout(output_file):
+            try:
+                return tuner._train_and_evaluate(config, num_episodes, eval_games,
+                                                 config_id, output_dir=output_dir)
+            except Exception:
+                traceback.print_exc(file=output_file)
+                raise
+
+
 class AutoMLTuner:
     """
     Optimisation automatique des hyperparamètres pour Q-Learning.
@@ -38,7 +76,8 @@ class AutoMLTuner:
     def grid_search(self, param_grid: Dict[str, List], 
                    num_episodes: int = 10000,
                    eval_games: int = 100,
-                   max_configs: Optional[int] = None) -> Dict:
+                   max_configs: Optional[int] = None,
+                   n_workers: int = 1) -> Dict:
         """
         Grid Search : teste toutes les combinaisons d'hyperparamètres.
         
@@ -47,6 +86,7 @@ class AutoMLTuner:
             num_episodes: Nombre d'épisodes d'entraînement par config
             eval_games: Nombre de parties d'évaluation
             max_configs: Nombre max de configurations à tester
+            n_workers: Nombre de processus (> 1 : configurations en parallèle)
         
         Returns:
             Meilleure configuration trouvée
@@ -67,31 +107,16 @@ class AutoMLTuner:
         total_configs = len(all_combinations)
         print(f"\n📊 Nombre de configurations à tester: {total_configs}")
         print(f"⏱️  Épisodes par config: {num_episodes}")
-        print(f"📈 Évaluation: {eval_games} parties\n")
-        print("=" * 70 + "\n")
+        print(f"📈 Évaluation: {eval_games} parties")
+        if n_workers > 1:
+            print(f"🧵 Processus: {n_workers}")
+        print("\n" + "=" * 70 + "\n")
         
         start_time = time.time()
         
         # Tester chaque configuration
-        for i, combination in enumerate(all_combinations, 1):
-            config = dict(zip(param_names, combination))
-            
-            print(f"\n[{i}/{total_configs}] Test de configuration:")
-            for key, value in config.items():
-                print(f"  {key}: {value}")
-            print()
-            
-            # Entraîner et évaluer
-            result = self._train_and_evaluate(config, num_episodes, eval_games, i)
-            self.results.append(result)
-            
-            # Mettre à jour le meilleur
-            if result['composite_score'] > self.best_score:
-                self.best_score = result['composite_score']
-                self.best_config = config
-                print(f"  🏆 NOUVEAU MEILLEUR! Score: {self.best_score:.2f}")
-            else:
-                print(f"  Score: {result['composite_score']:.2f} (meilleur: {self.best_score:.2f})")
+        configs = [dict(zip(param_names, combination)) for combination in all_combinations]
+        self._run_configs(configs, num_episodes, eval_games, n_workers, "")
         
         duration = time.time() - start_time
         
@@ -119,7 +144,8 @@ class AutoMLTuner:
     def random_search(self, param_distributions: Dict[str, tuple], 
                      n_iter: int = 20,
                      num_episodes: int = 10000,
-                     eval_games: int = 100) -> Dict:
+                     eval_games: int = 100,
+                     n_workers: int = 1) -> Dict:
         """
         Random Search : échantillonne aléatoirement les hyperparamètres.
         
@@ -128,6 +154,7 @@ class AutoMLTuner:
             n_iter: Nombre d'itérations
             num_episodes: Épisodes d'entraînement par config
             eval_games: Parties d'évaluation
+            n_workers: Nombre de processus (> 1 : configurations en parallèle)
         
         Returns:
             Meilleure configuration trouvée
@@ -137,13 +164,16 @@ class AutoMLTuner:
         print("=" * 70)
         print(f"\n📊 Nombre d'itérations: {n_iter}")
         print(f"⏱️  Épisodes par config: {num_episodes}")
-        print(f"📈 Évaluation: {eval_games} parties\n")
-        print("=" * 70 + "\n")
+        print(f"📈 Évaluation: {eval_games} parties")
+        if n_workers > 1:
+            print(f"🧵 Processus: {n_workers}")
+        print("\n" + "=" * 70 + "\n")
         
         start_time = time.time()
         
-        for i in range(1, n_iter + 1):
-            # Échantillonner une configuration aléatoire
+        # Échantillonner toutes les configurations avant de les répartir
+        configs = []
+        for _ in range(n_iter):
             config = {}
             for param, (min_val, max_val) in param_distributions.items():
                 if param in ['alpha', 'gamma', 'epsilon_decay']:
@@ -152,23 +182,9 @@ class AutoMLTuner:
                     config[param] = random.uniform(min_val, max_val)
                 elif param == 'epsilon':
                     config[param] = random.uniform(min_val, max_val)
-            
-            print(f"\n[{i}/{n_iter}] Test de configuration:")
-            for key, value in config.items():
-                print(f"  {key}: {value:.4f}")
-            print()
-            
-            # Entraîner et évaluer
-            result = self._train_and_evaluate(config, num_episodes, eval_games, i)
-            self.results.append(result)
-            
-            # Mettre à jour le meilleur
-            if result['composite_score'] > self.best_score:
-                self.best_score = result['composite_score']
-                self.best_config = config
-                print(f"  🏆 NOUVEAU MEILLEUR! Score: {self.best_score:.2f}")
-            else:
-                print(f"  Score: {result['composite_score']:.2f} (meilleur: {self.best_score:.2f})")
+            configs.append(config)
+        
+        self._run_configs(configs, num_episodes, eval_games, n_workers, ".4f")
         
         duration = time.time() - start_time
         
@@ -193,8 +209,67 @@ class AutoMLTuner:
             'duration': duration
         }
     
+    def _run_configs(self, configs: List[Dict], num_episodes: int,
+                     eval_games: int, n_workers: int, value_format: str):
+        """
+        Entraîne et évalue chaque configuration, en série ou sur n_workers
+        processus, et enregistre les résultats.
+        
+        Args:
+            configs: Configurations à tester (config_id = position + 1)
+            num_episodes: Épisodes d'entraînement par config
+            eval_games: Parties d'évaluation
+            n_workers: Nombre de processus
+            value_format: Format d'affichage des valeurs d'hyperparamètres
+        """
+        total = len(configs)
+        
+        if n_workers <= 1:
+            for i, config in enumerate(configs, 1):
+                self._print_config(i, total, config, value_format)
+                result = self._train_and_evaluate(config, num_episodes, eval_games, i)
+                self._record_result(result)
+            return
+        
+        first = len(self.results)
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [executor.submit(_train_config_worker,
+                                       (config, num_episodes, eval_games, i))
+                       for i, config in enumerate(configs, 1)]
+            for done, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+                self._print_config(result['config_id'], total, result['config'],
+                                   value_format, done)
+                self._record_result(result)
+        print(f"\n📁 Modèles et logs de chaque configuration: {AUTOML_OUTPUT_DIR}/config_<id>/")
+        
+        # Même ordre qu'en série pour le CSV
+        self.results[first:] = sorted(self.results[first:], key=lambda r: r['config_id'])
+    
+    @staticmethod
+    def _print_config(config_id: int, total: int, config: Dict,
+                      value_format: str, done: Optional[int] = None):
+        """Affiche une configuration (done: nombre de configs terminées, en parallèle)"""
+        progress = f" - {done}/{total} terminées" if done is not None else ""
+        print(f"\n[{config_id}/{total}{progress}] Test de configuration:")
+        for key, value in config.items():
+            print(f"  {key}: {value:{value_format}}")
+        print()
+    
+    def _record_result(self, result: Dict):
+        """Ajoute un résultat et met à jour la meilleure configuration"""
+        self.results.append(result)
+        
+        if result['composite_score'] > self.best_score:
+            self.best_score = result['composite_score']
+            self.best_config = result['config']
+            print(f"  🏆 NOUVEAU MEILLEUR! Score: {self.best_score:.2f}")
+        else:
+            print(f"  Score: {result['composite_score']:.2f} (meilleur: {self.best_score:.2f})")
+    
     def _train_and_evaluate(self, config: Dict, num_episodes: int, 
-                           eval_games: int, config_id: int) -> Dict:
+                           eval_games: int, config_id: int,
+                           output_dir: Optional[Path] = None) -> Dict:
         """
         Entraîne et évalue un agent avec une configuration donnée.
         
@@ -203,6 +278,7 @@ class AutoMLTuner:
             num_episodes: Nombre d'épisodes d'entraînement
             eval_games: Nombre de parties d'évaluation
             config_id: ID de la configuration
+            output_dir: Dossier des logs et modèles (logs/ et models/ si None)
         
         Returns:
             Résultats détaillés
@@ -217,8 +293,12 @@ class AutoMLTuner:
         )
         
         # Entraîner
-        logger = RLLogger()
-        model_manager = ModelManager()
+        if output_dir is None:
+            logger = RLLogger()
+            model_manager = ModelManager()
+        else:
+            logger = RLLogger(logs_dir=str(output_dir / "logs"))
+            model_manager = ModelManager(models_dir=str(output_dir / "models"))
         trainer = Trainer(agent, self.env, logger, model_manager)
         
         train_start = time.time()
@@ -240,14 +320,14 @@ class AutoMLTuner:
             'total_episodes': num_episodes,
             'hyperparameters': config,
             'performance': {
-                'states_learned': len(agent.q_table),
+                'states_learned': agent.states_learned,
                 'avg_reward': train_stats.get('avg_reward', 0),
                 'avg_moves': train_stats.get('avg_episode_length', 0)
             }
         }
         
         model_data = {
-            'states': len(agent.q_table),
+            'states': agent.states_learned,
             'epsilon': agent.epsilon,
             'metadata': metadata
         }
@@ -264,7 +344,7 @@ class AutoMLTuner:
             'eval_win_rate': eval_stats['win_rate'],
             'eval_draw_rate': eval_stats['draw_rate'],
             'eval_loss_rate': eval_stats['loss_rate'],
-            'states_learned': len(agent.q_table),
+            'states_learned': agent.states_learned,
             'final_epsilon': agent.epsilon,
             'composite_score': metrics.get('composite_score', 0),
             'performance_score': metrics.get('performance_score', 0),
@@ -0,0 +1,437 @@
+"""
+Noyaux numériques compilés (Numba) pour la boucle d'entraînement
+Joue un épisode complet sur un plateau np.int8[9] et une Q-table dense
+np.float32[3^9, 9], sans passer par l'interpréteur Python à chaque coup.
+
+Numba est optionnel : sans lui, les fonctions restent utilisables en Python
+pur (plus lent) et le Trainer utilise sa boucle Python classique.
+"""
+
+import os
+import numpy as np
+from engine.lookup_tables import (
+    POW3, EMPTY_BOARD_INDEX, ONGOING, WINNER_LUT, LEGAL_MASK_LUT,
+    POPCOUNT_LUT, LOWEST_BIT_LUT, SYMMETRY_PERMS, SYMMETRY_ACTIONS
+)
+
+try:
+    from numba import njit, prange, config as numba_config
+    NUMBA_AVAILABLE = True
+    # Les workers d'entraînement parallèle sont créés par fork après le
+    # lancement du pool de threads de batched_eval : TBB bloque alors à la
+    # sortie du processus, workqueue supporte le fork
+    if "NUMBA_THREADING_LAYER" not in os.environ:
+        numba_config.THREADING_LAYER = "workqueue"
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Décorateur neutre utilisé quand numba n'est pas installé"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Puissances de 3 sous forme de tableau (constante pour numba) : poser le
+# pion `p` sur la case `a` fait varier l'index du plateau de p * 3^a
+POW3_ARRAY = np.array(POW3, dtype=np.int64)
+
+
+@njit(cache=True)
+def encode_board(board):
+    """Encode le plateau en index base 3 (même formule que state_to_index)"""
+    index = 0
+    power = 1
+    for i in range(9):
+        index += (int(board[i]) + 1) * power
+        power *= 3
+    return index
+
+
+@njit(cache=True)
+def _nth_legal(state_idx, k):
+    """
+    k-ième case vide (ordre croissant) : les k bits de poids faible du
+    masque des cases libres sont effacés, puis le suivant est lu
+    """
+    mask = np.int64(LEGAL_MASK_LUT[state_idx])
+    for _ in range(k):
+        mask &= mask - 1
+    return LOWEST_BIT_LUT[mask]
+
+
+@njit(cache=True)
+def _greedy_candidates(q_values, state_idx, candidates):
+    """
+    Remplit candidates avec les actions légales de Q maximale (ordre
+    croissant), en ne parcourant que les bits des cases libres.
+
+    Returns:
+        Nombre de candidates
+    """
+    mask = np.int64(LEGAL_MASK_LUT[state_idx])
+    best_q = -np.inf
+    n = 0
+    while mask:
+        a = LOWEST_BIT_LUT[mask]
+        mask &= mask - 1
+        q = q_values[state_idx, a]
+        if q > best_q:
+            best_q = q
+            candidates[0] = a
+            n = 1
+        elif q == best_q:
+            candidates[n] = a
+            n += 1
+    return n
+
+
+@njit(cache=True)
+def random_legal_action(state_idx):
+    """Choisit uniformément une case vide"""
+    return _nth_legal(state_idx, np.random.randint(POPCOUNT_LUT[LEGAL_MASK_LUT[state_idx]]))
+
+
+@njit(cache=True)
+def greedy_action(q_values, state_idx):
+    """Meilleure action légale, égalités départagées aléatoirement"""
+    candidates = np.empty(9, dtype=np.int64)
+    n = _greedy_candidates(q_values, state_idx, candidates)
+    return candidates[np.random.randint(n)]
+
+
+@njit(cache=True)
+def _set_symmetric(q_values, q_visited, state_idx, action, value):
+    """Écrit value dans les 8 couples (état, action) symétriques de (s, a)"""
+    digits = np.empty(9, dtype=np.int64)
+    rest = state_idx
+    for i in range(9):
+        digits[i] = rest % 3
+        rest //= 3
+    for k in range(SYMMETRY_PERMS.shape[0]):
+        image = 0
+        for i in range(9):
+            image += digits[SYMMETRY_PERMS[k, i]] * POW3_ARRAY[i]
+        q_values[image, SYMMETRY_ACTIONS[k, action]] = value
+        q_visited[image] = 1
+
+
+@njit(cache=True)
+def q_update(q_values, q_visited, state_idx, action, reward,
+             next_idx, alpha, gamma, done, symmetric):
+    """
+    Q[s,a] += α * (r + γ * max Q[s',a'] - Q[s,a])
+    Si symmetric, la nouvelle valeur est recopiée sur les 8 plateaux
+    équivalents par symétrie (Q-table invariante par rotation/miroir)
+    """
+    if done:
+        target = reward
+    else:
+        legal_mask = LEGAL_MASK_LUT[next_idx]
+        max_next_q = -np.inf
+        for a in range(9):
+            if legal_mask >> a & 1 and q_values[next_idx, a] > max_next_q:
+                max_next_q = q_values[next_idx, a]
+        target = reward + gamma * max_next_q
+    q_values[state_idx, action] += alpha * (target - q_values[state_idx, action])
+    q_visited[state_idx] = 1
+    if symmetric:
+        _set_symmetric(q_values, q_visited, state_idx, action,
+                       q_values[state_idx, action])
+
+
+@njit(cache=True)
+def play_episode_jit(q_values, q_visited, board, epsilon, alpha, gamma,
+                     agent_starts, symmetric):
+    """
+    Joue un épisode d'entraînement contre un adversaire aléatoire.
+    Reproduit exactement les récompenses de Trainer.play_episode.
+
+    Returns:
+        (winner, num_moves) avec winner = 1 (X), -1 (O) ou 0 (nul)
+    """
+    board[:] = 0
+    state_idx = EMPTY_BOARD_INDEX
+    agent_symbol = 1 if agent_starts else -1
+    num_moves = 0
+    winner = 0
+
+    # Si l'agent ne commence pas, l'adversaire (X) joue
+    if not agent_starts:
+        action = random_legal_action(state_idx)
+        board[action] = -agent_symbol
+        state_idx -= agent_symbol * POW3_ARRAY[action]
+        num_moves += 1
+
+    while True:
+        # Tour de l'agent (ε-greedy)
+        agent_idx = state_idx
+        if np.random.random() < epsilon:
+            action = random_legal_action(state_idx)
+        else:
+            action = greedy_action(q_values, agent_idx)
+        board[action] = agent_symbol
+        state_idx += agent_symbol * POW3_ARRAY[action]
+        num_moves += 1
+
+        outcome = int(WINNER_LUT[state_idx])
+        if outcome != ONGOING:
+            winner = outcome
+            reward = 1.0 if winner == agent_symbol else 0.5
+            q_update(q_values, q_visited, agent_idx, action, reward,
+                     state_idx, alpha, gamma, True, symmetric)
+            break
+
+        # Tour de l'adversaire
+        opponent_action = random_legal_action(state_idx)
+        board[opponent_action] = -agent_symbol
+        state_idx -= agent_symbol * POW3_ARRAY[opponent_action]
+        num_moves += 1
+
+        outcome = int(WINNER_LUT[state_idx])
+        done = outcome != ONGOING
+        # Comme dans Trainer.play_episode : la récompense de l'adversaire
+        # (1.0 victoire, 0.5 nul) est > 0, donc l'agent reçoit -1.0 dans
+        # les deux cas quand la partie se termine sur le coup adverse
+        final_reward = -1.0 if done else 0.0
+        q_update(q_values, q_visited, agent_idx, action, final_reward,
+                 state_idx, alpha, gamma, done, symmetric)
+        if done:
+            winner = outcome
+            break
+
+    return winner, num_moves
+
+
+@njit(cache=True)
+def train_episodes(q_values, q_visited, board, epsilons, agent_starts,
+                   alpha, gamma, symmetric):
+    """
+    Enchaîne un bloc d'épisodes d'entraînement dans le noyau compilé
+    (un seul appel depuis Python au lieu d'un par épisode).
+
+    Args:
+        epsilons: ε de chaque épisode (N,)
+        agent_starts: Si l'agent joue X, pour chaque épisode (N,)
+
+    Returns:
+        (winners, num_moves) int8 (N,) avec winner = 1 (X), -1 (O) ou 0 (nul)
+    """
+    n = epsilons.shape[0]
+    winners = np.zeros(n, dtype=np.int8)
+    num_moves = np.zeros(n, dtype=np.int8)
+    for e in range(n):
+        winner, moves = play_episode_jit(
+            q_values, q_visited, board, epsilons[e], alpha, gamma,
+            agent_starts[e], symmetric)
+        winners[e] = winner
+        num_moves[e] = moves
+    return winners, num_moves
+
+
+# Au plus 5 transitions de l'agent par épisode (5 coups sur 9)
+MAX_AGENT_MOVES = 5
+
+
+@njit(cache=True)
+def rollout_episodes(q_values, epsilons, agent_starts):
+    """
+    Joue un lot d'épisodes SANS mise à jour, avec une Q-table figée, et
+    enregistre les transitions de l'agent pour une mise à jour différée
+    (Q-learning est off-policy). Mêmes règles et récompenses que
+    play_episode_jit.
+
+    Args:
+        q_values: Q-table (lecture seule)
+        epsilons: ε de chaque épisode
+        agent_starts: booléen par épisode (l'agent joue X)
+
+    Returns:
+        (states, actions, rewards, next_states, dones, winners, num_moves)
+    """
+    n_episodes = epsilons.shape[0]
+    max_transitions = n_episodes * MAX_AGENT_MOVES
+    states = np.empty(max_transitions, dtype=np.int64)
+    actions = np.empty(max_transitions, dtype=np.int64)
+    rewards = np.empty(max_transitions, dtype=np.float32)
+    next_states = np.empty(max_transitions, dtype=np.int64)
+    dones = np.empty(max_transitions, dtype=np.bool_)
+    winners = np.empty(n_episodes, dtype=np.int8)
+    moves = np.empty(n_episodes, dtype=np.int8)
+    t = 0
+
+    for e in range(n_episodes):
+        state_idx = EMPTY_BOARD_INDEX
+        agent_symbol = 1 if agent_starts[e] else -1
+        num_moves = 0
+        winner = 0
+
+        if not agent_starts[e]:
+            action = random_legal_action(state_idx)
+            state_idx -= agent_symbol * POW3_ARRAY[action]
+            num_moves += 1
+
+        while True:
+            agent_idx = state_idx
+            if np.random.random() < epsilons[e]:
+                action = random_legal_action(state_idx)
+            else:
+                action = greedy_action(q_values, agent_idx)
+            state_idx += agent_symbol * POW3_ARRAY[action]
+            num_moves += 1
+
+            states[t] = agent_idx
+            actions[t] = action
+            next_states[t] = state_idx
+
+            outcome = int(WINNER_LUT[state_idx])
+            if outcome != ONGOING:
+                winner = outcome
+                rewards[t] = 1.0 if winner == agent_symbol else 0.5
+                dones[t] = True
+                t += 1
+                break
+
+            opponent_action = random_legal_action(state_idx)
+            state_idx -= agent_symbol * POW3_ARRAY[opponent_action]
+            num_moves += 1
+
+            outcome = int(WINNER_LUT[state_idx])
+            done = outcome != ONGOING
+            next_states[t] = state_idx
+            rewards[t] = -1.0 if done else 0.0  # Voir play_episode_jit
+            dones[t] = done
+            t += 1
+            if done:
+                winner = outcome
+                break
+
+        winners[e] = winner
+        moves[e] = num_moves
+
+    return (states[:t], actions[:t], rewards[:t], next_states[:t], dones[:t],
+            winners, moves)
+
+
+@njit(cache=True)
+def replay_transitions(q_values, q_visited, states, actions, rewards,
+                       next_states, dones, alpha, gamma, symmetric):
+    """Applique les transitions dans l'ordre (mise à jour Q-learning exacte)"""
+    for t in range(states.shape[0]):
+        q_update(q_values, q_visited, states[t], actions[t], rewards[t],
+                 next_states[t], alpha, gamma, dones[t], symmetric)
+
+
+# Nombre de tirages uniformes réservés par partie d'évaluation :
+# 2 par coup de l'agent (exploration + choix), 1 par coup adverse
+EVAL_UNIFORMS_PER_GAME = 18
+
+
+@njit(cache=True)
+def _pick_empty(state_idx, u):
+    """Retourne la k-ième case vide, k = floor(u * nb_cases_vides)"""
+    return _nth_legal(state_idx, int(u * POPCOUNT_LUT[LEGAL_MASK_LUT[state_idx]]))
+
+
+@njit(cache=True)
+def _pick_greedy(q_values, policy, state_idx, u):
+    """
+    Meilleure action légale, lue dans la politique précalculée si elle y
+    figure (voir QLearningAgent.get_policy_table), sinon égalités
+    départagées par le tirage u
+    """
+    action = policy[state_idx]
+    if action >= 0:
+        return action
+    candidates = np.empty(9, dtype=np.int64)
+    n = _greedy_candidates(q_values, state_idx, candidates)
+    return candidates[int(u * n)]
+
+
+@njit(cache=True)
+def play_eval_game(q_values, policy, epsilon, uniforms, agent_starts):
+    """
+    Joue une partie d'évaluation (sans mise à jour) à partir de tirages
+    uniformes précalculés, ce qui la rend déterministe et thread-safe.
+
+    Returns:
+        (winner, num_moves) avec winner = 1 (X), -1 (O) ou 0 (nul)
+    """
+    state_idx = EMPTY_BOARD_INDEX
+    player = 1
+    agent_symbol = 1 if agent_starts else -1
+    cursor = 0
+    num_moves = 0
+    outcome = ONGOING
+
+    while outcome == ONGOING:
+        if player == agent_symbol:
+            if uniforms[cursor] < epsilon:
+                action = _pick_empty(state_idx, uniforms[cursor + 1])
+            else:
+                action = _pick_greedy(q_values, policy, state_idx,
+                                      uniforms[cursor + 1])
+            cursor += 2
+        else:
+            action = _pick_empty(state_idx, uniforms[cursor])
+            cursor += 1
+        state_idx += player * POW3_ARRAY[action]
+        num_moves += 1
+
+        outcome = int(WINNER_LUT[state_idx])
+        player = -player
+
+    return outcome, num_moves
+
+
+@njit(cache=True, parallel=True)
+def batched_eval(q_values, policy, epsilon, uniforms, games_per_seed):
+    """
+    Joue toutes les parties d'évaluation (seeds x parties) en parallèle.
+    La ligne `lane` de `uniforms` alimente la partie `lane` ; l'agent
+    commence une partie sur deux dans chaque seed.
+
+    Returns:
+        (winners, num_moves) : tableaux int8 d'une entrée par partie
+    """
+    n_lanes = uniforms.shape[0]
+    winners = np.empty(n_lanes, dtype=np.int8)
+    moves = np.empty(n_lanes, dtype=np.int8)
+    for lane in prange(n_lanes):
+        agent_starts = (lane % games_per_seed) % 2 == 0
+        winner, num_moves = play_eval_game(q_values, policy, epsilon,
+                                           uniforms[lane], agent_starts)
+        winners[lane] = winner
+        moves[lane] = num_moves
+    return winners, moves
+
+
+@njit(cache=True)
+def seed_kernels(seed):
+    """Initialise le générateur aléatoire utilisé par les noyaux"""
+    np.random.seed(seed)
+
+
+_compiled = False
+
+
+def pre_compile():
+    """
+    Force la compilation des noyaux (une seule fois par processus).
+    Évite de payer la latence JIT au premier épisode.
+    """
+    global _compiled
+    if _compiled or not NUMBA_AVAILABLE:
+        return
+    q_values = np.zeros((3 ** 9, 9), dtype=np.float32)
+    q_visited = np.zeros(3 ** 9, dtype=np.uint8)
+    board = np.zeros(9, dtype=np.int8)
+    play_episode_jit(q_values, q_visited, board, 1.0, 0.1, 0.9, True, False)
+    play_episode_jit(q_values, q_visited, board, 0.0, 0.1, 0.9, False, True)
+    # Bloc vide : compile sans consommer de tirages aléatoires
+    train_episodes(q_values, q_visited, board, np.zeros(0),
+                   np.zeros(0, dtype=np.bool_), 0.1, 0.9, False)
+    policy = np.full(3 ** 9, -1, dtype=np.int8)
+    batched_eval(q_values, policy, 0.0, np.zeros((2, EVAL_UNIFORMS_PER_GAME)), 2)
+    _compiled = True
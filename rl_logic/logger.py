@@ -31,11 +31,13 @@ class RLLogger:
         self.games_file = self.logs_dir / "game_history.json"
         self.training_file = self.logs_dir / "training_stats.csv"
         self.eval_file = self.logs_dir / "evaluation_results.json"
+        self.eval_seeds_file = self.logs_dir / "evaluation_seeds.json"
         
         # Historique en mémoire
         self.games_history: List[Dict] = []
         self.training_stats: List[Dict] = []
         self.evaluation_results: List[Dict] = []
+        self.evaluation_seeds: List[Dict] = []
         
         # Charger les historiques existants
         self._load_histories()
@@ -126,6 +128,33 @@ class RLLogger:
         self.evaluation_results.append(eval_record)
         self._save_evaluation()
     
+    def log_evaluation_summary(self, seed: int, wins: int, losses: int, draws: int,
+                               duration: float):
+        """
+        Enregistre le bilan d'une seed d'évaluation (remplace une entrée par partie).
+        
+        Args:
+            seed: Seed utilisée
+            wins: Nombre de victoires
+            losses: Nombre de défaites
+            draws: Nombre de nuls
+            duration: Durée des parties de cette seed en secondes
+        """
+        num_games = wins + losses + draws
+        seed_record = {
+            'timestamp': datetime.now().isoformat(),
+            'seed': seed,
+            'num_games': num_games,
+            'wins': wins,
+            'losses': losses,
+            'draws': draws,
+            'win_rate': wins / num_games * 100 if num_games > 0 else 0,
+            'duration': duration
+        }
+        
+        self.evaluation_seeds.append(seed_record)
+        self._save_evaluation_seeds()
+    
     def get_game_stats(self, player_name: Optional[str] = None,
                       last_n: Optional[int] = None) -> Dict:
         """
@@ -279,9 +308,11 @@ class RLLogger:
             self.games_history = []
             self.training_stats = []
             self.evaluation_results = []
+            self.evaluation_seeds = []
             self._save_games()
             self._save_training_stats()
             self._save_evaluation()
+            self._save_evaluation_seeds()
             print("✓ Historique effacé")
         else:
             print("⚠ Passez confirm=True pour effacer l'historique")
@@ -336,6 +367,14 @@ class RLLogger:
                     self.evaluation_results = json.load(f)
             except Exception:
                 self.evaluation_results = []
+        
+        # Charger les bilans par seed
+        if self.eval_seeds_file.exists():
+            try:
+                with open(self.eval_seeds_file, 'r', encoding='utf-8') as f:
+                    self.evaluation_seeds = json.load(f)
+            except Exception:
+                self.evaluation_seeds = []
     
     def _save_games(self):
         """Sauvegarde l'historique des parties"""
@@ -383,3 +422,11 @@ class RLLogger:
                 json.dump(self.evaluation_results, f, indent=2, ensure_ascii=False)
         except Exception as e:
             print(f"Erreur sauvegarde évaluations: {e}")
+    
+    def _save_evaluation_seeds(self):
+        """Sauvegarde les bilans d'évaluation par seed"""
+        try:
+            with open(self.eval_seeds_file, 'w', encoding='utf-8') as f:
+                json.dump(self.evaluation_seeds, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(f"Erreur sauvegarde bilans par seed: {e}")
@@ -4,7 +4,7 @@ Fournit des métriques avancées pour évaluer et comparer les modèles.
 """
 
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from collections import defaultdict
 
 
@@ -13,6 +13,29 @@ class ModelMetrics:
     Calcule des métriques avancées pour évaluer les modèles Q-Learning.
     """
     
+    # Métriques déjà calculées, par (chemin du modèle, date de modification)
+    _cache: Dict[Tuple[str, float], Optional[Dict]] = {}
+    
+    @classmethod
+    def cached_metrics(cls, path: str, mtime: float,
+                       compute: Callable[[], Optional[Dict]]) -> Optional[Dict]:
+        """
+        Retourne les métriques d'un fichier modèle, calculées une seule fois
+        tant que le fichier n'est pas modifié.
+        
+        Args:
+            path: Chemin du fichier modèle
+            mtime: Date de modification du fichier (os.path.getmtime)
+            compute: Calcul des métriques, appelé seulement en l'absence de cache
+        
+        Returns:
+            Métriques (ou None si compute n'a rien pu calculer)
+        """
+        key = (path, mtime)
+        if key not in cls._cache:
+            cls._cache[key] = compute()
+        return cls._cache[key]
+    
     @staticmethod
     def calculate_performance_score(win_rate: float, draw_rate: float, 
                                     loss_rate: float) -> float:
@@ -8,6 +8,8 @@ import json
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from .metrics import ModelMetrics
+from .model_manager import ModelManager
+from .agent import QLearningAgent
 import pandas as pd
 
 
@@ -60,6 +62,13 @@ class ModelComparator:
             Données du modèle ou None si erreur
         """
         try:
+            if Path(filepath).suffix == '.npz':
+                # Infos du fichier compagnon + vue {état: {action: Q}} de la Q-table
+                model_data = ModelManager.load_model_info(filepath)
+                agent = QLearningAgent()
+                agent.q_values, agent.q_visited = ModelManager.load_q(filepath)
+                model_data['q_table'] = agent.q_table
+                return model_data
             with open(filepath, 'rb') as f:
                 return pickle.load(f)
         except Exception as e:
@@ -1,14 +1,19 @@
 """
 Gestionnaire de modèles
 Gère la sauvegarde, le chargement et le versionnage des modèles Q-Learning.
+Un modèle = Q-table dense en .npz (tableaux NumPy compressés, avec les
+informations du modèle en JSON) + fichier compagnon .meta.json pour les lire
+sans ouvrir le .npz. Les anciens modèles .pkl restent lisibles.
 """
 
 import pickle
 import json
 import os
+import numpy as np
 from datetime import datetime
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from pathlib import Path
+from engine.environment import NUM_STATES, state_to_index
 
 
 class ModelManager:
@@ -17,6 +22,9 @@ class ModelManager:
     Supporte le versionnage automatique avec horodatage.
     """
     
+    # Format courant en premier, puis format historique (pickle)
+    MODEL_SUFFIXES = ('.npz', '.pkl')
+    
     def __init__(self, models_dir: str = "models"):
         """
         Initialise le gestionnaire de modèles.
@@ -28,7 +36,7 @@ class ModelManager:
         self.models_dir.mkdir(exist_ok=True)
         
         # Fichiers par défaut
-        self.default_model = self.models_dir / "q_table.pkl"
+        self.default_model = self.models_dir / "q_table.npz"
         self.metadata_file = self.models_dir / "models_metadata.json"
         
         # Charger ou créer les métadonnées
@@ -54,30 +62,34 @@ class ModelManager:
         else:
             if versioned:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"{name}_{timestamp}.pkl"
+                filename = f"{name}_{timestamp}.npz"
             else:
-                filename = f"{name}.pkl"
+                filename = f"{name}.npz"
             filepath = self.models_dir / filename
         
-        # Préparer les données à sauvegarder
+        # Préparer les données à sauvegarder (la Q-table est écrite à part)
         model_data = {
-            'q_table': agent.get_q_table_copy(),
             'hyperparameters': {
                 'alpha': agent.alpha,
                 'gamma': agent.gamma,
                 'epsilon': agent.epsilon,
                 'epsilon_start': agent.epsilon_start,
                 'epsilon_min': agent.epsilon_min,
-                'epsilon_decay': agent.epsilon_decay
+                'epsilon_decay': agent.epsilon_decay,
+                'symmetric': agent.symmetric
             },
             'stats': agent.get_stats(),
             'timestamp': datetime.now().isoformat(),
             'metadata': metadata or {}
         }
         
-        # Sauvegarder avec pickle
-        with open(filepath, 'wb') as f:
-            pickle.dump(model_data, f)
+        # Q-table dense telle quelle (copie mémoire compressée, sans pickle),
+        # avec les informations du modèle : le .npz se suffit à lui-même
+        np.savez_compressed(filepath, q_values=agent.q_values, q_visited=agent.q_visited,
+                            info=np.array(json.dumps(model_data)))
+        
+        # Fichier compagnon : les mêmes informations, lisibles sans ouvrir le .npz
+        self._save_model_info(filepath, model_data)
         
         # Mettre à jour les métadonnées
         self._update_metadata(str(filepath), model_data)
@@ -99,29 +111,37 @@ class ModelManager:
         Returns:
             True si le chargement a réussi, False sinon
         """
-        if filepath is None:
-            filepath = self.default_model
-        else:
-            filepath = Path(filepath)
+        filepath = self._resolve(filepath)
         
         try:
-            with open(filepath, 'rb') as f:
-                model_data = pickle.load(f)
-            
-            # Charger la Q-table
-            agent.load_q_table(model_data['q_table'])
+            if filepath.suffix == '.npz':
+                agent.q_values[:], agent.q_visited[:] = self.load_q(filepath)
+                try:
+                    model_data = self.load_model_info(filepath)
+                except FileNotFoundError:
+                    # .npz d'avant l'intégration des infos, sans fichier compagnon
+                    print(f"⚠️  {self.info_path(filepath).name} introuvable : "
+                          f"hyperparamètres actuels de l'agent conservés")
+                    model_data = {}
+            else:
+                # Ancien format : dictionnaire complet picklé
+                with open(filepath, 'rb') as f:
+                    model_data = pickle.load(f)
+                agent.load_q_table(model_data['q_table'])
             
             # Restaurer les hyperparamètres
-            params = model_data['hyperparameters']
-            agent.alpha = params['alpha']
-            agent.gamma = params['gamma']
-            agent.epsilon = params['epsilon']
-            agent.epsilon_start = params['epsilon_start']
-            agent.epsilon_min = params['epsilon_min']
-            agent.epsilon_decay = params['epsilon_decay']
+            params = model_data.get('hyperparameters')
+            if params:
+                agent.alpha = params['alpha']
+                agent.gamma = params['gamma']
+                agent.epsilon = params['epsilon']
+                agent.epsilon_start = params['epsilon_start']
+                agent.epsilon_min = params['epsilon_min']
+                agent.epsilon_decay = params['epsilon_decay']
+                agent.symmetric = params.get('symmetric', False)
             
             print(f"✓ Modèle chargé: {filepath}")
-            print(f"  États appris: {len(agent.q_table)}")
+            print(f"  États appris: {agent.states_learned}")
             print(f"  Epsilon: {agent.epsilon:.6f}")
             print(f"  Date: {model_data.get('timestamp', 'N/A')}")
             
@@ -144,12 +164,96 @@ class ModelManager:
         Returns:
             True si le modèle existe, False sinon
         """
-        if filepath is None:
-            filepath = self.default_model
-        else:
-            filepath = Path(filepath)
+        return self._resolve(filepath).exists()
+    
+    def _resolve(self, filepath=None) -> Path:
+        """
+        Chemin effectif d'un modèle : le modèle par défaut si None, et
+        l'ancien fichier .pkl si la version .npz n'existe pas.
+        
+        Args:
+            filepath: Chemin du modèle (ou None)
+        
+        Returns:
+            Chemin à lire
+        """
+        filepath = self.default_model if filepath is None else Path(filepath)
+        legacy = filepath.with_suffix('.pkl')
+        if filepath.suffix == '.npz' and not filepath.exists() and legacy.exists():
+            return legacy
+        return filepath
+    
+    def model_files(self) -> List[Path]:
+        """Fichiers de modèles du répertoire (.npz et anciens .pkl)"""
+        return [path for suffix in self.MODEL_SUFFIXES
+                for path in self.models_dir.glob(f"*{suffix}")]
+    
+    @staticmethod
+    def load_q(filepath) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Charge uniquement la Q-table dense d'un modèle.
         
-        return filepath.exists()
+        Args:
+            filepath: Chemin du modèle (.npz, ou ancien .pkl)
+        
+        Returns:
+            (q_values float32 [3^9, 9], q_visited uint8 [3^9])
+        """
+        filepath = Path(filepath)
+        if filepath.suffix == '.npz':
+            # Seuls les deux tableaux demandés sont décompressés
+            with np.load(filepath) as data:
+                return data['q_values'], data['q_visited']
+        
+        with open(filepath, 'rb') as f:
+            q_table = pickle.load(f)['q_table']
+        q_values = np.zeros((NUM_STATES, 9), dtype=np.float32)
+        q_visited = np.zeros(NUM_STATES, dtype=np.uint8)
+        for state, actions in q_table.items():
+            index = state_to_index(state[0])
+            q_visited[index] = 1
+            for action, q_value in actions.items():
+                q_values[index, action] = q_value
+        return q_values, q_visited
+    
+    @staticmethod
+    def info_path(filepath) -> Path:
+        """Fichier JSON compagnon d'un modèle (model_X.npz -> model_X.meta.json)"""
+        return Path(filepath).with_suffix('.meta.json')
+    
+    @staticmethod
+    def load_model_info(filepath) -> Dict:
+        """
+        Charge les informations d'un modèle sans sa Q-table.
+        Lit le fichier .meta.json s'il existe, sinon les infos intégrées au
+        .npz, ou le pickle complet (modèles .pkl sauvegardés avant l'ajout
+        du fichier compagnon).
+        
+        Args:
+            filepath: Chemin du fichier .npz ou .pkl
+        
+        Returns:
+            Dictionnaire avec hyperparameters, stats, timestamp et metadata
+        
+        Raises:
+            FileNotFoundError: .npz sans infos intégrées ni fichier compagnon
+        """
+        info_file = ModelManager.info_path(filepath)
+        if info_file.exists():
+            with open(info_file, 'r') as f:
+                return json.load(f)
+        if Path(filepath).suffix == '.npz':
+            # Seule l'entrée 'info' est décompressée, pas la Q-table
+            with np.load(filepath) as data:
+                if 'info' in data.files:
+                    return json.loads(str(data['info']))
+            # .npz sauvegardé avant l'intégration des infos
+            raise FileNotFoundError(f"Fichier compagnon introuvable: {info_file}")
+        
+        with open(filepath, 'rb') as f:
+            model_data = pickle.load(f)
+        model_data.pop('q_table', None)
+        return model_data
     
     def list_models(self) -> List[Dict]:
         """
@@ -169,13 +273,15 @@ class ModelManager:
             for filepath, meta in self.metadata.items():
                 filepath_obj = Path(filepath)
                 if filepath_obj.exists():
+                    file_stat = filepath_obj.stat()
                     models.append({
                         'name': filepath_obj.name,
                         'path': str(filepath_obj),
                         'timestamp': meta.get('timestamp', 'N/A'),
                         'states': meta.get('states', 0),
                         'epsilon': meta.get('epsilon', 1.0),
-                        'size_mb': filepath_obj.stat().st_size / (1024 * 1024),
+                        'size_mb': file_stat.st_size / (1024 * 1024),
+                        'mtime': file_stat.st_mtime,
                         # Inclure les métadonnées complètes
                         'metadata': meta.get('metadata', {}),
                         'final_win_rate': meta.get('final_win_rate', 0),
@@ -185,19 +291,20 @@ class ModelManager:
                     })
         else:
             # Fallback : charger directement depuis les fichiers
-            for pkl_file in self.models_dir.glob("*.pkl"):
+            for model_file in self.model_files():
                 try:
-                    with open(pkl_file, 'rb') as f:
-                        model_data = pickle.load(f)
+                    model_data = self.load_model_info(model_file)
                     
                     metadata = model_data.get('metadata', {})
+                    file_stat = model_file.stat()
                     models.append({
-                        'name': pkl_file.name,
-                        'path': str(pkl_file),
+                        'name': model_file.name,
+                        'path': str(model_file),
                         'timestamp': model_data.get('timestamp', 'N/A'),
                         'states': model_data['stats']['total_states'],
                         'epsilon': model_data['stats']['epsilon'],
-                        'size_mb': pkl_file.stat().st_size / (1024 * 1024),
+                        'size_mb': file_stat.st_size / (1024 * 1024),
+                        'mtime': file_stat.st_mtime,
                         'metadata': metadata,
                         'final_win_rate': metadata.get('final_win_rate', 0),
                         'final_draw_rate': metadata.get('final_draw_rate', 0),
@@ -205,7 +312,7 @@ class ModelManager:
                         'total_episodes': metadata.get('total_episodes', 0),
                     })
                 except Exception as e:
-                    print(f"Erreur lecture {pkl_file.name}: {e}")
+                    print(f"Erreur lecture {model_file.name}: {e}")
         
         # Trier par date (plus récent en premier)
         models.sort(key=lambda x: x['timestamp'], reverse=True)
@@ -225,6 +332,7 @@ class ModelManager:
             filepath = Path(filepath)
             if filepath.exists():
                 filepath.unlink()
+                self.info_path(filepath).unlink(missing_ok=True)
                 # Retirer des métadonnées
                 if str(filepath) in self.metadata:
                     del self.metadata[str(filepath)]
@@ -294,6 +402,23 @@ class ModelManager:
         except Exception as e:
             print(f"Erreur sauvegarde métadonnées: {e}")
     
+    def _save_model_info(self, filepath: Path, model_data: Dict):
+        """
+        Écrit le fichier compagnon .meta.json (modèle sans la Q-table).
+        Écriture dans un fichier temporaire puis os.replace : jamais de
+        fichier compagnon tronqué, et les erreurs remontent à save_model.
+        """
+        info = {key: value for key, value in model_data.items() if key != 'q_table'}
+        info_file = self.info_path(filepath)
+        tmp_file = info_file.with_name(info_file.name + '.tmp')
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump(info, f, indent=2)
+            os.replace(tmp_file, info_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+    
     def _update_metadata(self, filepath: str, model_data: Dict):
         """Met à jour les métadonnées avec les infos d'un modèle"""
         # Inclure TOUTES les métadonnées du modèle
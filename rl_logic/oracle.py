@@ -0,0 +1,77 @@
+"""
+Oracle du Morpion (jeu résolu)
+Calcule par minimax la Q-table que le Q-learning atteindrait face à un
+adversaire parfait, avec les récompenses de Trainer.play_episode :
+1.0 victoire, 0.5 nul, -1.0 défaite, 0.0 sinon (actualisées par gamma).
+Seule différence : un nul conclu par le coup adverse vaut 0.5 et non -1.0,
+sinon l'oracle ne distinguerait pas nul et défaite quand il joue O.
+Sert d'initialisation à l'agent.
+"""
+
+from functools import lru_cache
+from typing import Tuple
+import numpy as np
+
+from engine.lookup_tables import (
+    NUM_STATES, NUM_CELLS, POW3, EMPTY_BOARD_INDEX, ONGOING,
+    WINNER_LUT, LEGAL_ACTIONS_LUT
+)
+
+
+@lru_cache(maxsize=4)
+def _solve(gamma: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Résout le jeu une fois par valeur de gamma (tables en lecture seule)"""
+    q_values = np.zeros((NUM_STATES, NUM_CELLS), dtype=np.float32)
+    visited = np.zeros(NUM_STATES, dtype=np.uint8)
+    state_values = {}
+
+    def state_value(index: int, player: int) -> float:
+        """max_a Q[s, a] pour l'agent `player` au trait, en remplissant Q[s, ·]"""
+        if index in state_values:
+            return state_values[index]
+        best = -np.inf
+        for action in LEGAL_ACTIONS_LUT[index]:
+            after_move = index + player * POW3[action]
+            outcome = WINNER_LUT[after_move]
+            if outcome != ONGOING:
+                q = 1.0 if outcome == player else 0.5
+            else:
+                # L'adversaire choisit la réponse la pire pour l'agent
+                q = np.inf
+                for reply in LEGAL_ACTIONS_LUT[after_move]:
+                    after_reply = after_move - player * POW3[reply]
+                    reply_outcome = WINNER_LUT[after_reply]
+                    if reply_outcome == -player:
+                        q = min(q, -1.0)
+                    elif reply_outcome != ONGOING:
+                        q = min(q, 0.5)
+                    else:
+                        q = min(q, gamma * state_value(after_reply, player))
+            q_values[index, action] = q
+            best = max(best, q)
+        visited[index] = 1
+        state_values[index] = best
+        return best
+
+    # Agent X, puis agent O après chacune des premières réponses de X
+    state_value(EMPTY_BOARD_INDEX, 1)
+    for first_move in range(NUM_CELLS):
+        state_value(EMPTY_BOARD_INDEX + POW3[first_move], -1)
+
+    q_values.flags.writeable = False
+    visited.flags.writeable = False
+    return q_values, visited
+
+
+def oracle_q_values(gamma: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Q-table optimale face à un adversaire parfait (minimax).
+
+    Args:
+        gamma: Facteur d'actualisation de l'agent
+
+    Returns:
+        (q_values float32 [3^9, 9], q_visited uint8 [3^9]), copies modifiables
+    """
+    q_values, visited = _solve(float(gamma))
+    return q_values.copy(), visited.copy()
@@ -0,0 +1,141 @@
+"""
+Entraînement parallèle par collecte d'expérience off-policy
+Des processus workers jouent des épisodes contre un adversaire aléatoire avec
+une copie figée de la Q-table, et renvoient leurs transitions (s, a, r, s', done).
+Le processus principal les rejoue dans l'ordre (Q-learning est off-policy, une
+politique de comportement légèrement en retard reste valide).
+
+La Q-table vit en mémoire partagée pendant l'entraînement : les workers s'y
+attachent une fois au démarrage et lisent directement la version à jour à
+chaque tour, sans copie ni sérialisation.
+"""
+
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+from typing import Iterator, Optional, Tuple
+
+from . import kernels
+
+
+# Q-table partagée, vue depuis un worker (renseignée par _attach_q_table)
+_worker_shm: Optional[shared_memory.SharedMemory] = None
+_worker_q_values: Optional[np.ndarray] = None
+
+
+def _attach_q_table(shm_name: str, shape: Tuple[int, int], dtype: str):
+    """Initialiseur du pool : s'attache au segment de la Q-table partagée"""
+    global _worker_shm, _worker_q_values
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_q_values = np.ndarray(shape, dtype=dtype, buffer=_worker_shm.buf)
+
+
+def _rollout_worker(task: Tuple) -> Tuple:
+    """
+    Joue un lot d'épisodes dans un worker (fonction de module: picklable).
+
+    Args:
+        task: (epsilons, agent_starts, seed)
+
+    Returns:
+        Transitions et issues du lot (voir kernels.rollout_episodes)
+    """
+    epsilons, agent_starts, seed = task
+    # Après un fork, chaque worker hérite du même état aléatoire
+    kernels.seed_kernels(seed)
+    return kernels.rollout_episodes(_worker_q_values, epsilons, agent_starts)
+
+
+class ParallelEpisodeRunner:
+    """
+    Répartit les épisodes d'entraînement sur num_workers processus.
+    Un tour de sync_interval épisodes est joué avec la même Q-table, puis
+    les transitions collectées sont appliquées à l'agent.
+    Pendant run(), agent.q_values pointe sur la Q-table partagée ; une copie
+    ordinaire lui est rendue à la fin.
+    """
+
+    def __init__(self, agent, num_workers: int, sync_interval: int = 1000):
+        """
+        Initialise le répartiteur.
+
+        Args:
+            agent: Agent Q-Learning à entraîner
+            num_workers: Nombre de processus workers
+            sync_interval: Nombre d'épisodes entre deux synchronisations
+        """
+        self.agent = agent
+        self.num_workers = num_workers
+        self.sync_interval = sync_interval
+
+    def _epsilon_schedule(self, num_episodes: int) -> np.ndarray:
+        """ε de chaque épisode du tour, à partir de l'ε courant de l'agent"""
+        decay = self.agent.epsilon_decay ** np.arange(num_episodes)
+        return np.maximum(self.agent.epsilon_min,
+                          self.agent.epsilon * decay).astype(np.float64)
+
+    def run(self, num_episodes: int) -> Iterator[Tuple[Optional[int], int]]:
+        """
+        Joue num_episodes épisodes et les restitue dans l'ordre.
+        L'appelant décroît epsilon après chaque épisode, comme en série :
+        le tour suivant repart donc de la bonne valeur.
+
+        Args:
+            num_episodes: Nombre total d'épisodes
+
+        Yields:
+            (gagnant ou None, nombre de coups) pour chaque épisode
+        """
+        kernels.pre_compile()
+        q_values = self.agent.q_values
+        shm = shared_memory.SharedMemory(create=True, size=q_values.nbytes)
+        shared_q = np.ndarray(q_values.shape, dtype=q_values.dtype, buffer=shm.buf)
+        shared_q[:] = q_values
+        self.agent.q_values = shared_q
+        del q_values
+
+        try:
+            yield from self._run_rounds(num_episodes, shm.name, shared_q)
+        finally:
+            # Rendre une Q-table indépendante du segment avant de le libérer
+            self.agent.q_values = shared_q.copy()
+            del shared_q
+            shm.close()
+            shm.unlink()
+
+    def _run_rounds(self, num_episodes: int, shm_name: str,
+                    shared_q: np.ndarray) -> Iterator[Tuple[Optional[int], int]]:
+        """Boucle des tours de collecte/mise à jour (voir run)"""
+        episode_ids = np.arange(num_episodes)
+        seeds = np.random.SeedSequence().generate_state(
+            (num_episodes + self.sync_interval - 1) // self.sync_interval * self.num_workers)
+
+        with multiprocessing.Pool(self.num_workers, initializer=_attach_q_table,
+                                  initargs=(shm_name, shared_q.shape,
+                                            shared_q.dtype.str)) as pool:
+            for round_idx, start in enumerate(range(0, num_episodes, self.sync_interval)):
+                round_ids = episode_ids[start:start + self.sync_interval]
+                epsilons = self._epsilon_schedule(len(round_ids))
+
+                tasks = []
+                for worker, chunk in enumerate(np.array_split(np.arange(len(round_ids)),
+                                                              self.num_workers)):
+                    if len(chunk) == 0:
+                        continue
+                    # Même alternance qu'en série: l'agent commence aux épisodes impairs
+                    agent_starts = round_ids[chunk] % 2 == 0
+                    seed = int(seeds[round_idx * self.num_workers + worker])
+                    tasks.append((epsilons[chunk], agent_starts, seed))
+
+                results = pool.map(_rollout_worker, tasks)
+
+                # Les workers sont à l'arrêt entre deux map() : écriture sans conflit
+                for states, actions, rewards, next_states, dones, _, _ in results:
+                    kernels.replay_transitions(
+                        shared_q, self.agent.q_visited, states, actions,
+                        rewards, next_states, dones, self.agent.alpha, self.agent.gamma,
+                        self.agent.symmetric)
+
+                for *_, winners, moves in results:
+                    for winner, num_moves in zip(winners.tolist(), moves.tolist()):
+                        yield (winner or None), num_moves
@@ -3,14 +3,249 @@ Module d'entraînement des agents RL
 Gère la boucle d'entraînement, l'évaluation et la décroissance de l'epsilon.
 """
 
+import os
+import sys
+import math
 import time
+import random
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+from collections import deque
+from datetime import datetime
+from pathlib import Path
 from typing import Tuple, Optional, Dict
-from engine.environment import TicTacToeEnvironment
+from engine.environment import TicTacToeEnvironment, BatchedTicTacToeEnv
 from .agent import QLearningAgent, RandomAgent
+from . import kernels
+from .parallel_training import ParallelEpisodeRunner
 from .logger import RLLogger
 from .model_manager import ModelManager
 
 
+# Indices du compteur de résultats (victoires, défaites, nuls)
+_WIN, _LOSS, _DRAW = range(3)
+
+# Issue pour l'agent : _OUTCOME[agent_starts][gagnant + 1] (gagnant -1/0/1)
+_OUTCOME = (
+    (_WIN, _DRAW, _LOSS),   # L'agent joue O
+    (_LOSS, _DRAW, _WIN),   # L'agent joue X
+)
+# Récompense d'épisode par issue
+_REWARD = (1.0, -1.0, 0.0)
+# Mêmes tables en NumPy, pour traiter un bloc d'épisodes d'un coup
+_OUTCOME_LUT = np.array(_OUTCOME, dtype=np.intp)
+_REWARD_LUT = np.array(_REWARD)
+
+# Séparateurs des rapports console
+SEP = "=" * 70
+THIN_SEP = "─" * 70
+
+# En dessous de ce nombre total de parties, l'évaluation vectorisée d'une seed
+# est plus rapide que le démarrage d'un pool de processus
+EVAL_POOL_MIN_GAMES = 200_000
+
+
+def _write_report(lines):
+    """Écrit un bloc de lignes sur la sortie standard en une seule écriture"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _play_eval_game(env: TicTacToeEnvironment, agent, opponent,
+                    agent_starts: bool) -> Tuple[Optional[int], int]:
+    """
+    Joue une partie sans apprentissage (évaluation).
+    
+    Args:
+        env: Environnement (réinitialisé ici)
+        agent: Agent évalué
+        opponent: Adversaire
+        agent_starts: Si True, l'agent joue en premier (X)
+    
+    Returns:
+        winner: 1 (X), -1 (O) ou None (nul)
+        num_moves: Nombre de coups joués
+    """
+    state = env.reset()
+    # Joueur au trait selon la parité du coup
+    players = (agent, opponent) if agent_starts else (opponent, agent)
+    done = False
+    num_moves = 0
+    
+    while not done:
+        action = players[num_moves & 1].choose_action(state, env.legal_actions())
+        state, _, done = env.apply_action(action)
+        num_moves += 1
+    
+    return env.get_winner(), num_moves
+
+
+def _outcome_rates(counts: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Convertit des compteurs (victoires, défaites, nuls) en pourcentages.
+    
+    Args:
+        counts: Compteurs indexés par _WIN, _LOSS, _DRAW
+    
+    Returns:
+        (taux de victoire, taux de défaite, taux de nul), 0 si aucun épisode
+    """
+    total = int(counts.sum())
+    if total == 0:
+        return 0.0, 0.0, 0.0
+    rates = counts / total * 100
+    return float(rates[_WIN]), float(rates[_LOSS]), float(rates[_DRAW])
+
+
+class OnlineStats:
+    """
+    Moyenne, écart-type, min et max d'une série de valeurs, mis à jour à
+    chaque valeur (algorithme de Welford) sans conserver la série.
+    """
+    
+    __slots__ = ('n', 'mean', 'M2', 'mn', 'mx')
+    
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.M2 = 0.0  # Somme des carrés des écarts à la moyenne
+        self.mn = math.inf
+        self.mx = -math.inf
+    
+    def push(self, x: float):
+        """Ajoute une valeur"""
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.M2 += delta * (x - self.mean)
+        self.mn = min(self.mn, x)
+        self.mx = max(self.mx, x)
+    
+    @property
+    def std(self) -> float:
+        """Écart-type de population (comme np.std), 0 si moins de 2 valeurs"""
+        return math.sqrt(self.M2 / self.n) if self.n > 1 else 0.0
+
+
+def _kth_legal(masks: np.ndarray, uniforms: np.ndarray) -> np.ndarray:
+    """
+    Choisit, dans chaque ligne de masks, la k-ième case autorisée avec
+    k = floor(u * nb_cases) (même règle que kernels._pick_empty).
+    
+    Args:
+        masks: Masques booléens (N, 9)
+        uniforms: Tirages uniformes (N,)
+    
+    Returns:
+        Indices des cases choisies (N,)
+    """
+    k = (uniforms * masks.sum(axis=1)).astype(np.intp)
+    hits = (np.cumsum(masks, axis=1) == (k + 1)[:, None]) & masks
+    return hits.argmax(axis=1)
+
+
+def _play_eval_batch(q_values: np.ndarray, policy: np.ndarray, epsilon: float,
+                     uniforms: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Joue toutes les parties d'évaluation ensemble dans un BatchedTicTacToeEnv
+    (9 pas vectorisés au plus), à partir des mêmes tirages que
+    kernels.batched_eval : les résultats sont identiques au noyau Numba.
+    
+    Args:
+        q_values: Q-table dense figée de l'agent
+        policy: Politique gloutonne précalculée (QLearningAgent.get_policy_table)
+        epsilon: Taux d'exploration pour l'évaluation
+        uniforms: Tirages (num_games, EVAL_UNIFORMS_PER_GAME), une ligne par partie
+    
+    Returns:
+        (gagnants, nombres de coups) : tableaux int8 d'une entrée par partie
+    """
+    num_games = uniforms.shape[0]
+    env = BatchedTicTacToeEnv(num_games)
+    lanes = np.arange(num_games)
+    # L'agent joue X aux parties paires
+    agent_symbols = np.where(lanes % 2 == 0, 1, -1)
+    cursors = np.zeros(num_games, dtype=np.intp)
+    dones = env.dones.copy()
+    
+    while not dones.all():
+        legal = env.legal_masks()
+        agent_turn = agent_symbols == env.current_player
+        # Agent : 2 tirages (exploration, choix) ; adversaire : 1 tirage (choix)
+        first = uniforms[lanes, cursors]
+        second = uniforms[lanes, np.minimum(cursors + 1, uniforms.shape[1] - 1)]
+        
+        random_moves = _kth_legal(legal, np.where(agent_turn, second, first))
+        # Coup glouton lu dans la politique ; Q-valeurs relues seulement
+        # pour les états à égalité (départagés par le tirage)
+        greedy_moves = policy[env.state_indices].astype(np.intp)
+        ties = np.flatnonzero(greedy_moves < 0)
+        if len(ties):
+            tie_legal = legal[ties]
+            q = np.where(tie_legal, q_values[env.state_indices[ties]], -np.inf)
+            best = tie_legal & (q == q.max(axis=1, keepdims=True))
+            greedy_moves[ties] = _kth_legal(best, second[ties])
+        
+        actions = np.where(agent_turn & (first >= epsilon), greedy_moves, random_moves)
+        cursors += np.where(dones, 0, np.where(agent_turn, 2, 1))
+        _, _, dones = env.step(actions)
+    
+    return env.get_winners(), env.num_moves.copy()
+
+
+def _eval_one_seed(q_values: np.ndarray, policy: np.ndarray, epsilon: float, seed: int,
+                   num_games: int) -> Tuple[int, np.ndarray, np.ndarray, float]:
+    """
+    Joue les parties d'évaluation d'une seed contre l'adversaire aléatoire
+    (fonction de module: picklable, exécutée par un worker du pool).
+    
+    Args:
+        q_values: Q-table dense figée de l'agent
+        policy: Politique gloutonne précalculée (QLearningAgent.get_policy_table)
+        epsilon: Taux d'exploration pour l'évaluation
+        seed: Seed du générateur des tirages
+        num_games: Nombre de parties (l'agent commence les parties paires)
+    
+    Returns:
+        (seed, gagnants, nombres de coups, durée en secondes)
+    """
+    start_time = time.time()
+    uniforms = np.random.default_rng(seed).random(
+        (num_games, kernels.EVAL_UNIFORMS_PER_GAME))
+    winners, moves = _play_eval_batch(q_values, policy, epsilon, uniforms)
+    return seed, winners, moves, time.time() - start_time
+
+
+# Tables d'évaluation vues depuis un worker (renseignées par _attach_eval_tables)
+_eval_shm: Optional[shared_memory.SharedMemory] = None
+_eval_q_values: Optional[np.ndarray] = None
+_eval_policy: Optional[np.ndarray] = None
+
+
+def _attach_eval_tables(shm_name: str, shape: Tuple[int, int], dtype: str,
+                        policy: np.ndarray):
+    """Initialiseur du pool d'évaluation : s'attache à la Q-table partagée"""
+    global _eval_shm, _eval_q_values, _eval_policy
+    _eval_shm = shared_memory.SharedMemory(name=shm_name)
+    _eval_q_values = np.ndarray(shape, dtype=dtype, buffer=_eval_shm.buf)
+    _eval_policy = policy
+
+
+def _eval_seed_worker(task: Tuple[float, int, int]) -> Tuple[int, np.ndarray, np.ndarray, float]:
+    """
+    Évalue une seed dans un worker à partir des tables partagées.
+    
+    Args:
+        task: (epsilon, seed, num_games)
+    
+    Returns:
+        Voir _eval_one_seed
+    """
+    epsilon, seed, num_games = task
+    return _eval_one_seed(_eval_q_values, _eval_policy, epsilon, seed, num_games)
+
+
 class Trainer:
     """
     Gère l'entraînement et l'évaluation des agents Q-Learning.
@@ -19,7 +254,8 @@ class Trainer:
     
     def __init__(self, agent: QLearningAgent, env: TicTacToeEnvironment,
                  logger: Optional[RLLogger] = None,
-                 model_manager: Optional[ModelManager] = None):
+                 model_manager: Optional[ModelManager] = None,
+                 telemetry_dir: Optional[str] = None):
         """
         Initialise le trainer.
         
@@ -28,6 +264,8 @@ class Trainer:
             env: Environnement du jeu
             logger: Logger pour l'enregistrement (créé si None)
             model_manager: Gestionnaire de modèles (créé si None)
+            telemetry_dir: Répertoire des fichiers rewards.f32 / lengths.i16
+                (np.memmap, pour les très longs entraînements). None = en mémoire
         """
         self.agent = agent
         self.env = env
@@ -35,12 +273,86 @@ class Trainer:
         self.model_manager = model_manager or ModelManager()
         self.opponent = RandomAgent()
         
+        # Plateau de travail pour le noyau compilé (réutilisé à chaque épisode)
+        self._board = np.zeros(9, dtype=np.int8)
+        
         # Statistiques d'entraînement (buffer avant logging)
-        self.episode_rewards = []
-        self.episode_lengths = []
-        self.wins = 0
-        self.losses = 0
-        self.draws = 0
+        # Tableaux préalloués au début de train(), remplis par index
+        # (projetés sur disque si telemetry_dir est fourni)
+        self.telemetry_dir = Path(telemetry_dir) if telemetry_dir else None
+        self._rewards = np.empty(0, dtype=np.float32)
+        self._lengths = np.empty(0, dtype=np.int16)
+        self._num_recorded = 0
+        # Sommes courantes (moyennes de fin d'entraînement sans reparcourir les tableaux)
+        self._reward_sum = 0.0
+        self._length_sum = 0
+        # Fenêtre glissante des 1000 derniers épisodes (affichage)
+        self._recent_rewards = deque(maxlen=1000)
+        self._recent_lengths = deque(maxlen=1000)
+        # Compteurs victoires / défaites / nuls, incrémentés à chaque épisode
+        self._results = np.zeros(3, dtype=np.int64)
+    
+    @property
+    def wins(self) -> int:
+        """Victoires de l'agent à l'entraînement"""
+        return int(self._results[_WIN])
+    
+    @property
+    def losses(self) -> int:
+        """Défaites de l'agent à l'entraînement"""
+        return int(self._results[_LOSS])
+    
+    @property
+    def draws(self) -> int:
+        """Matchs nuls à l'entraînement"""
+        return int(self._results[_DRAW])
+    
+    @property
+    def episode_rewards(self) -> np.ndarray:
+        """Récompenses des épisodes enregistrés (vue, sans copie)"""
+        return self._rewards[:self._num_recorded]
+    
+    @property
+    def episode_lengths(self) -> np.ndarray:
+        """Longueurs des épisodes enregistrés (vue, sans copie)"""
+        return self._lengths[:self._num_recorded]
+    
+    def _reserve(self, num_episodes: int):
+        """Agrandit les tableaux de statistiques pour num_episodes épisodes de plus"""
+        capacity = self._num_recorded + num_episodes
+        if capacity <= len(self._rewards):
+            return
+        if self.telemetry_dir is not None:
+            self._rewards = self._map_telemetry("rewards.f32", np.float32, capacity)
+            self._lengths = self._map_telemetry("lengths.i16", np.int16, capacity)
+            return
+        rewards = np.empty(capacity, dtype=np.float32)
+        lengths = np.empty(capacity, dtype=np.int16)
+        rewards[:self._num_recorded] = self.episode_rewards
+        lengths[:self._num_recorded] = self.episode_lengths
+        self._rewards = rewards
+        self._lengths = lengths
+    
+    def _map_telemetry(self, filename: str, dtype, capacity: int) -> np.memmap:
+        """
+        Projette un fichier de statistiques en mémoire (np.memmap).
+        Le fichier est agrandi sur place : les épisodes déjà enregistrés sont conservés.
+        
+        Args:
+            filename: Nom du fichier dans telemetry_dir
+            dtype: Type des valeurs
+            capacity: Nombre total d'épisodes à pouvoir stocker
+        
+        Returns:
+            Tableau projeté sur le fichier
+        """
+        self.telemetry_dir.mkdir(parents=True, exist_ok=True)
+        path = self.telemetry_dir / filename
+        # Nouveau run: repartir d'un fichier vide
+        mode = 'r+b' if self._num_recorded and path.exists() else 'w+b'
+        with open(path, mode) as f:
+            f.truncate(capacity * np.dtype(dtype).itemsize)
+        return np.memmap(path, dtype=dtype, mode='r+', shape=(capacity,))
     
     def play_episode(self, agent_starts: bool = True, 
                     update_agent: bool = True) -> Tuple[Optional[int], int]:
@@ -55,15 +367,32 @@ class Trainer:
             winner: 1 (X), -1 (O) ou None (nul)
             num_moves: Nombre de coups joués
         """
+        # Chemin rapide: épisode entier dans le noyau compilé (Numba)
+        if (update_agent and kernels.NUMBA_AVAILABLE 
+                and isinstance(self.opponent, RandomAgent)):
+            winner, num_moves = kernels.play_episode_jit(
+                self.agent.q_values, self.agent.q_visited, self._board,
+                self.agent.epsilon, self.agent.alpha, self.agent.gamma,
+                agent_starts, self.agent.symmetric
+            )
+            return (winner if winner != 0 else None), num_moves
+        
+        if not update_agent:
+            return self._play_episode_eval(agent_starts)
+        
         state = self.env.reset()
         done = False
         num_moves = 0
         
+        # Actions légales de l'état courant, calculées une seule fois après
+        # chaque coup puis réutilisées par tous les appels qui portent sur cet état
+        legal_actions = self.env.legal_actions()
+        
         # Si l'agent ne commence pas, l'adversaire joue
         if not agent_starts:
-            legal_actions = self.env.legal_actions(state)
             action = self.opponent.choose_action(state, legal_actions)
             state, _, done = self.env.apply_action(action)
+            legal_actions = self.env.legal_actions()
             num_moves += 1
         
         # Boucle de jeu
@@ -72,10 +401,10 @@ class Trainer:
         
         while not done:
             # Tour de l'agent
-            legal_actions = self.env.legal_actions(state)
             action = self.agent.choose_action(state, legal_actions)
             
             next_state, reward, done = self.env.apply_action(action)
+            legal_actions = self.env.legal_actions()
             num_moves += 1
             
             # Sauvegarder pour mise à jour après le tour de l'adversaire
@@ -83,43 +412,114 @@ class Trainer:
             agent_prev_action = action
             
             # Si l'agent gagne directement
-            if update_agent and done:
-                next_legal_actions = self.env.legal_actions(next_state)
-                self.agent.update(state, action, reward, next_state, 
-                                next_legal_actions, done)
-            
             if done:
+                self.agent.update(state, action, reward, self.env.state_index, done)
                 break
             
             state = next_state
             
-            # Tour de l'adversaire
-            legal_actions = self.env.legal_actions(state)
+            # Tour de l'adversaire (même état : actions légales déjà connues)
             opponent_action = self.opponent.choose_action(state, legal_actions)
             
             state, opponent_reward, done = self.env.apply_action(opponent_action)
+            legal_actions = self.env.legal_actions()
             num_moves += 1
             
             # Mise à jour de l'agent après le tour de l'adversaire
-            if update_agent:
-                # Si l'adversaire a gagné, l'agent reçoit une récompense négative
-                if done and opponent_reward > 0:
-                    final_reward = -1.0
-                elif done and opponent_reward == 0.5:
-                    final_reward = 0.5  # Match nul
-                else:
-                    final_reward = 0.0  # Partie continue
-                
-                next_legal_actions = self.env.legal_actions(state)
-                self.agent.update(agent_prev_state, agent_prev_action, final_reward, 
-                                state, next_legal_actions, done)
+            # Si l'adversaire a gagné, l'agent reçoit une récompense négative
+            if done and opponent_reward > 0:
+                final_reward = -1.0
+            elif done and opponent_reward == 0.5:
+                final_reward = 0.5  # Match nul
+            else:
+                final_reward = 0.0  # Partie continue
+            
+            self.agent.update(agent_prev_state, agent_prev_action, final_reward, 
+                            self.env.state_index, done)
         
         winner = self.env.get_winner()
         return winner, num_moves
     
+    def _play_training_block(self, agent_starts: np.ndarray, epsilons: np.ndarray,
+                             parallel_episodes=None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Joue un bloc d'épisodes d'entraînement.
+        Avec Numba et un adversaire aléatoire, le bloc entier tourne dans un
+        seul appel compilé ; sinon épisode par épisode.
+        
+        Args:
+            agent_starts: Si l'agent joue X, pour chaque épisode (N,)
+            epsilons: ε de chaque épisode (N,)
+            parallel_episodes: Générateur de ParallelEpisodeRunner.run (optionnel)
+        
+        Returns:
+            (winners, num_moves) int8 (N,) avec winner = 1 (X), -1 (O) ou 0 (nul)
+        """
+        if (parallel_episodes is None and kernels.NUMBA_AVAILABLE 
+                and isinstance(self.opponent, RandomAgent)):
+            return kernels.train_episodes(
+                self.agent.q_values, self.agent.q_visited, self._board,
+                epsilons, agent_starts, self.agent.alpha, self.agent.gamma,
+                self.agent.symmetric
+            )
+        
+        winners = np.zeros(len(agent_starts), dtype=np.int8)
+        num_moves = np.zeros(len(agent_starts), dtype=np.int8)
+        for i, (starts, epsilon) in enumerate(zip(agent_starts.tolist(), epsilons.tolist())):
+            self.agent.epsilon = epsilon
+            if parallel_episodes is not None:
+                winner, num_moves[i] = next(parallel_episodes)
+            else:
+                winner, num_moves[i] = self.play_episode(starts, update_agent=True)
+            winners[i] = winner or 0
+        return winners, num_moves
+    
+    def _record_episodes(self, agent_starts: np.ndarray, winners: np.ndarray,
+                         num_moves: np.ndarray):
+        """
+        Enregistre les résultats d'un bloc d'épisodes (compteurs, télémétrie,
+        fenêtres glissantes).
+        
+        Args:
+            agent_starts: Si l'agent jouait X, pour chaque épisode (N,)
+            winners: Gagnant de chaque épisode, 1 (X), -1 (O) ou 0 (nul)
+            num_moves: Nombre de coups de chaque épisode
+        """
+        outcomes = _OUTCOME_LUT[agent_starts.astype(np.intp), winners.astype(np.intp) + 1]
+        rewards = _REWARD_LUT[outcomes]
+        self._results += np.bincount(outcomes, minlength=3)
+        
+        recorded = slice(self._num_recorded, self._num_recorded + len(outcomes))
+        self._rewards[recorded] = rewards
+        self._lengths[recorded] = num_moves
+        self._num_recorded += len(outcomes)
+        self._reward_sum += float(rewards.sum())
+        self._length_sum += int(num_moves.sum())
+        self._recent_rewards.extend(rewards.tolist())
+        self._recent_lengths.extend(num_moves.tolist())
+    
+    def _play_episode_eval(self, agent_starts: bool,
+                           opponent=None) -> Tuple[Optional[int], int]:
+        """
+        Version de play_episode sans apprentissage (évaluation) : pas de
+        mémorisation du coup précédent ni de calcul de récompense.
+        
+        Args:
+            agent_starts: Si True, l'agent joue en premier (X)
+            opponent: Adversaire (self.opponent si None)
+        
+        Returns:
+            winner: 1 (X), -1 (O) ou None (nul)
+            num_moves: Nombre de coups joués
+        """
+        if opponent is None:
+            opponent = self.opponent
+        return _play_eval_game(self.env, self.agent, opponent, agent_starts)
+    
     def train(self, num_episodes: int, verbose: bool = True, 
              save_interval: int = 1000, log_interval: int = 100,
-             eval_games: int = 1000, eval_seeds: int = 3) -> Dict:
+             eval_games: int = 1000, eval_seeds: int = 3,
+             num_workers: int = 1, sync_interval: int = 1000) -> Dict:
         """
         Entraîne l'agent sur un nombre d'épisodes.
         
@@ -130,6 +530,10 @@ class Trainer:
             log_interval: Intervalle de logging (en épisodes)
             eval_games: Nombre de parties pour l'évaluation post-training (0 = pas d'évaluation)
             eval_seeds: Nombre de seeds différentes pour l'évaluation (pour robustesse)
+            num_workers: Processus de collecte d'épisodes (1 = entraînement en série).
+                En parallèle, les workers jouent avec une Q-table figée pendant
+                sync_interval épisodes (adversaire aléatoire uniquement)
+            sync_interval: Épisodes entre deux synchronisations de la Q-table
         
         Returns:
             Dictionnaire avec les statistiques d'entraînement
@@ -137,41 +541,52 @@ class Trainer:
         start_time = time.time()
         initial_epsilon = self.agent.epsilon
         
-        print("\n" + "=" * 70)
-        print(f"DÉBUT DE L'ENTRAÎNEMENT: {num_episodes} épisodes")
-        print("=" * 70)
-        print(f"Configuration:")
-        print(f"  Alpha (α): {self.agent.alpha}")
-        print(f"  Gamma (γ): {self.agent.gamma}")
-        print(f"  Epsilon initial (ε): {initial_epsilon:.4f}")
-        print(f"  Epsilon min: {self.agent.epsilon_min:.4f}")
-        print(f"  Decay: {self.agent.epsilon_decay:.6f}")
-        print("=" * 70 + "\n")
-        
-        for episode in range(1, num_episodes + 1):
+        _write_report([
+            "\n" + SEP,
+            f"DÉBUT DE L'ENTRAÎNEMENT: {num_episodes} épisodes",
+            SEP,
+            "Configuration:",
+            f"  Alpha (α): {self.agent.alpha}",
+            f"  Gamma (γ): {self.agent.gamma}",
+            f"  Epsilon initial (ε): {initial_epsilon:.4f}",
+            f"  Epsilon min: {self.agent.epsilon_min:.4f}",
+            f"  Decay: {self.agent.epsilon_decay:.6f}",
+            SEP + "\n",
+        ])
+        
+        # Compiler les noyaux avant la boucle (latence JIT hors chronométrage par épisode)
+        kernels.pre_compile()
+        self._reserve(num_episodes)
+        
+        # ε de chaque épisode, calculé en une fois : max(ε_min, ε_0 * decay^t)
+        epsilon_schedule = np.maximum(
+            self.agent.epsilon_min,
+            initial_epsilon * self.agent.epsilon_decay ** np.arange(num_episodes + 1)
+        )
+        results = self._results
+        # Compteurs avant ce run (train() peut être appelé plusieurs fois)
+        results_before = results.copy()
+        
+        parallel_episodes = None
+        if num_workers > 1 and isinstance(self.opponent, RandomAgent):
+            parallel_episodes = ParallelEpisodeRunner(
+                self.agent, num_workers, sync_interval).run(num_episodes)
+        
+        episode = 0
+        while episode < num_episodes:
+            # Bloc d'épisodes jusqu'au prochain logging ou affichage
+            end = min(num_episodes,
+                      (episode // log_interval + 1) * log_interval,
+                      (episode // 1000 + 1) * 1000)
             # Alterner qui commence (pour un entraînement équilibré)
-            agent_starts = episode % 2 == 1
-            
-            winner, num_moves = self.play_episode(agent_starts, update_agent=True)
-            
-            # Enregistrer les résultats
-            agent_symbol = self.env.PLAYER_X if agent_starts else self.env.PLAYER_O
-            
-            if winner == agent_symbol:
-                self.wins += 1
-                reward = 1.0
-            elif winner is None:
-                self.draws += 1
-                reward = 0.0
-            else:
-                self.losses += 1
-                reward = -1.0
-            
-            self.episode_rewards.append(reward)
-            self.episode_lengths.append(num_moves)
+            agent_starts = np.arange(episode + 1, end + 1) % 2 == 1
+            winners, num_moves = self._play_training_block(
+                agent_starts, epsilon_schedule[episode:end], parallel_episodes)
+            self._record_episodes(agent_starts, winners, num_moves)
+            episode = end
             
-            # Décroissance de l'epsilon
-            self.agent.decay_epsilon()
+            # Décroissance de l'epsilon (équivalent de agent.decay_epsilon())
+            self.agent.epsilon = float(epsilon_schedule[episode])
             
             # Logging périodique
             if episode % log_interval == 0:
@@ -181,25 +596,30 @@ class Trainer:
             if verbose and episode % 1000 == 0:
                 self._print_progress(episode, num_episodes)
         
+        if parallel_episodes is not None:
+            parallel_episodes.close()  # Libère le pool de workers
+        
         # ============================================================
         # ÉVALUATION POST-TRAINING (ε=0, pas de mise à jour)
         # ============================================================
-        print("\n" + "=" * 70)
-        print("🎯 ÉVALUATION POST-TRAINING MULTI-SEED")
-        print("=" * 70)
-        print(f"L'entraînement est terminé. Évaluation de la performance réelle...")
-        print(f"Parties d'évaluation: {eval_games} × {eval_seeds} seeds")
-        print(f"Epsilon: 0.0 (exploitation pure, pas d'exploration)")
-        print(f"Mise à jour Q-table: NON (évaluation seulement)")
-        print(f"Seeds: Reproductibles (42, 43, 44, ...)")
-        print("=" * 70)
-        
-        # Évaluation pure avec epsilon=0 et multiples seeds
-        eval_results = self.evaluate(
-            num_games=eval_games,
-            epsilon=0.0,
-            num_seeds=eval_seeds,
-            verbose=True
+        _write_report([
+            "\n" + SEP,
+            "🎯 ÉVALUATION POST-TRAINING MULTI-SEED",
+            SEP,
+            "L'entraînement est terminé. Évaluation de la performance réelle...",
+            f"Parties d'évaluation: {eval_games} × {eval_seeds} seeds",
+            "Epsilon: 0.0 (exploitation pure, pas d'exploration)",
+            "Mise à jour Q-table: NON (évaluation seulement)",
+            "Seeds: Reproductibles (42, 43, 44, ...)",
+            SEP,
+        ])
+        
+        # Évaluation pure avec epsilon=0 et multiples seeds (résultats affichés
+        # dans la comparaison train/eval ci-dessous)
+        eval_results, _, _ = self._evaluate_core(eval_games, 0.0, eval_seeds)
+        self.logger.log_evaluation(
+            eval_results['num_games'], eval_results['wins'], eval_results['losses'],
+            eval_results['draws'], agent_config=self.agent.get_stats()
         )
         
         # ============================================================
@@ -207,9 +627,10 @@ class Trainer:
         # ============================================================
         
         # Statistiques d'ENTRAÎNEMENT (historiques)
-        train_win_rate = self.wins / num_episodes * 100
-        train_draw_rate = self.draws / num_episodes * 100
-        train_loss_rate = self.losses / num_episodes * 100
+        avg_reward = self._reward_sum / self._num_recorded if self._num_recorded else 0
+        avg_moves = self._length_sum / self._num_recorded if self._num_recorded else 0
+        train_win_rate, train_loss_rate, train_draw_rate = _outcome_rates(
+            results - results_before)
         
         # Statistiques d'ÉVALUATION (vraie performance)
         eval_win_rate = eval_results['win_rate']
@@ -241,8 +662,8 @@ class Trainer:
                 'train_win_rate': train_win_rate,
                 'train_draw_rate': train_draw_rate,
                 'train_loss_rate': train_loss_rate,
-                'avg_reward': sum(self.episode_rewards) / len(self.episode_rewards) if self.episode_rewards else 0,
-                'avg_moves': sum(self.episode_lengths) / len(self.episode_lengths) if self.episode_lengths else 0
+                'avg_reward': avg_reward,
+                'avg_moves': avg_moves
             },
             
             # Hyperparamètres
@@ -252,14 +673,15 @@ class Trainer:
                 'epsilon_start': initial_epsilon,
                 'epsilon_final': self.agent.epsilon,
                 'epsilon_min': self.agent.epsilon_min,
-                'epsilon_decay': self.agent.epsilon_decay
+                'epsilon_decay': self.agent.epsilon_decay,
+                'symmetric': self.agent.symmetric
             },
             
             # Performance actuelle
             'performance': {
-                'states_learned': len(self.agent.q_table),
-                'avg_reward': sum(self.episode_rewards) / len(self.episode_rewards) if self.episode_rewards else 0,
-                'avg_moves': sum(self.episode_lengths) / len(self.episode_lengths) if self.episode_lengths else 0
+                'states_learned': self.agent.states_learned,
+                'avg_reward': avg_reward,
+                'avg_moves': avg_moves
             },
             
             # Flag pour indiquer que les métriques viennent de l'évaluation
@@ -268,26 +690,31 @@ class Trainer:
         }
         
         # Afficher le résumé comparatif
-        print("\n" + "=" * 70)
-        print("📊 COMPARAISON TRAIN vs EVAL")
-        print("=" * 70)
-        print(f"Win Rate:")
-        print(f"  • Training (moyenne): {train_win_rate:.1f}%")
-        print(f"  • Evaluation (ε=0):   {eval_win_rate:.1f}% ", end="")
+        win_rate_diff = round(eval_win_rate - train_win_rate, 1)
+        diff_str = f"✨ +{win_rate_diff}%" if eval_win_rate > train_win_rate else f"⚠️ {win_rate_diff}%"
+        eval_line = f"  • Evaluation (ε=0):   {eval_win_rate:.1f}% "
         if eval_seeds > 1:
-            print(f"± {eval_results.get('win_rate_std', 0):.1f}% ", end="")
-        diff_str = f"{'✨ +' + str(round(eval_win_rate - train_win_rate, 1)) + '%' if eval_win_rate > train_win_rate else '⚠️ ' + str(round(eval_win_rate - train_win_rate, 1)) + '%'}"
-        print(diff_str)
-        print(f"\nLoss Rate:")
-        print(f"  • Training: {train_loss_rate:.1f}%")
-        print(f"  • Evaluation: {eval_loss_rate:.1f}%")
+            eval_line += f"± {eval_results.get('win_rate_std', 0):.1f}% "
         
+        report = [
+            "\n" + SEP,
+            "📊 COMPARAISON TRAIN vs EVAL",
+            SEP,
+            "Win Rate:",
+            f"  • Training (moyenne): {train_win_rate:.1f}%",
+            eval_line + diff_str,
+            "\nLoss Rate:",
+            f"  • Training: {train_loss_rate:.1f}%",
+            f"  • Evaluation: {eval_loss_rate:.1f}%",
+        ]
         if eval_seeds > 1:
-            print(f"\n🎲 Robustesse (variance sur {eval_seeds} seeds):")
-            print(f"  • Écart-type: {eval_results.get('win_rate_std', 0):.2f}%")
-            print(f"  • Min-Max: [{eval_results.get('win_rate_min', 0):.1f}%, {eval_results.get('win_rate_max', 0):.1f}%]")
-        
-        print("=" * 70 + "\n")
+            report += [
+                f"\n🎲 Robustesse (variance sur {eval_seeds} seeds):",
+                f"  • Écart-type: {eval_results.get('win_rate_std', 0):.2f}%",
+                f"  • Min-Max: [{eval_results.get('win_rate_min', 0):.1f}%, {eval_results.get('win_rate_max', 0):.1f}%]",
+            ]
+        report.append(SEP + "\n")
+        _write_report(report)
         
         # Sauvegarder le modèle par défaut
         self.model_manager.save_model(
@@ -297,7 +724,6 @@ class Trainer:
         )
         
         # Sauvegarder aussi une version avec timestamp pour l'historique
-        from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         version_name = f"model_{num_episodes}ep"
         self.model_manager.save_model(
@@ -311,7 +737,8 @@ class Trainer:
         return self._get_training_stats(num_episodes, duration)
     
     def evaluate(self, num_games: int = 100, verbose: bool = True,
-                epsilon: float = 0.0, num_seeds: int = 1) -> Dict:
+                epsilon: float = 0.0, num_seeds: int = 1,
+                log_each_game: Optional[bool] = None) -> Dict:
         """
         Évalue l'agent contre un adversaire aléatoire sans mise à jour.
         
@@ -320,194 +747,275 @@ class Trainer:
             verbose: Affiche les résultats
             epsilon: Taux d'exploration pour l'évaluation (0 = exploitation pure)
             num_seeds: Nombre de seeds différentes à tester (pour robustesse)
+            log_each_game: Enregistre chaque partie dans l'historique
+                (None = seulement si num_games <= 100). Un bilan par seed
+                est toujours enregistré.
         
         Returns:
             Dictionnaire avec les statistiques d'évaluation (moyenne sur toutes les seeds)
         """
-        import random
-        import numpy as np
-        
-        print(f"\n{'='*70}")
+        print(f"\n{SEP}")
         print(f"ÉVALUATION: {num_games} parties × {num_seeds} seed(s) (epsilon={epsilon})")
-        print(f"{'='*70}\n")
-        
-        # Sauvegarder et modifier l'epsilon
-        original_epsilon = self.agent.epsilon
-        self.agent.set_epsilon(epsilon)
+        print(f"{SEP}\n")
         
-        # Résultats pour chaque seed
-        all_results = []
-        # Résultats pour chaque seed
-        all_results = []
+        if log_each_game is None:
+            log_each_game = num_games <= 100
         
-        overall_start_time = time.time()
+        results, winners, moves = self._evaluate_core(num_games, epsilon, num_seeds)
         
-        for seed_idx in range(num_seeds):
-            # Définir une seed différente pour chaque run
-            seed = 42 + seed_idx  # Seeds reproductibles : 42, 43, 44, ...
-            random.seed(seed)
-            np.random.seed(seed)
+        for seed_idx, seed_results in enumerate(results['all_seed_results']):
+            # Enregistrer dans l'historique
+            if log_each_game:
+                game_duration = seed_results['duration'] / num_games
+                for game in range(num_games):
+                    agent_starts = game % 2 == 0
+                    player_x = "Agent" if agent_starts else "Random"
+                    player_o = "Random" if agent_starts else "Agent"
+                    self.logger.log_game(player_x, player_o,
+                                         int(winners[seed_idx, game]) or None,
+                                         int(moves[seed_idx, game]), game_duration)
+            self.logger.log_evaluation_summary(
+                seed_results['seed'], seed_results['wins'], seed_results['losses'],
+                seed_results['draws'], seed_results['duration'])
             
             if num_seeds > 1 and verbose:
-                print(f"🎲 Seed {seed_idx + 1}/{num_seeds} (seed={seed})")
-            
-            wins = 0
-            losses = 0
-            draws = 0
-            
-            start_time = time.time()
-            
-            for game in range(1, num_games + 1):
-                agent_starts = game % 2 == 1
-                winner, num_moves = self.play_episode(agent_starts, update_agent=False)
-                
-                agent_symbol = self.env.PLAYER_X if agent_starts else self.env.PLAYER_O
-                
-                if winner == agent_symbol:
-                    wins += 1
-                elif winner is None:
-                    draws += 1
-                else:
-                    losses += 1
-                
-                # Enregistrer dans l'historique
-                player_x = "Agent" if agent_starts else "Random"
-                player_o = "Random" if agent_starts else "Agent"
-                self.logger.log_game(player_x, player_o, winner, num_moves,
-                                   time.time() - start_time)
-            
-            duration = time.time() - start_time
-            
-            # Stocker les résultats de cette seed
-            seed_results = {
-                'seed': seed,
-                'wins': wins,
-                'losses': losses,
-                'draws': draws,
-                'num_games': num_games,
-                'win_rate': wins / num_games * 100,
-                'loss_rate': losses / num_games * 100,
-                'draw_rate': draws / num_games * 100,
-                'duration': duration
-            }
-            all_results.append(seed_results)
-            
-            if num_seeds > 1 and verbose:
-                print(f"  Win: {wins}/{num_games} ({seed_results['win_rate']:.1f}%)")
-        
-        # Restaurer l'epsilon
-        self.agent.set_epsilon(original_epsilon)
-        
-        overall_duration = time.time() - overall_start_time
-        
-        # Calculer les statistiques agrégées
-        win_rates = [r['win_rate'] for r in all_results]
-        draw_rates = [r['draw_rate'] for r in all_results]
-        loss_rates = [r['loss_rate'] for r in all_results]
-        
-        avg_win_rate = np.mean(win_rates)
-        std_win_rate = np.std(win_rates) if num_seeds > 1 else 0.0
-        avg_draw_rate = np.mean(draw_rates)
-        avg_loss_rate = np.mean(loss_rates)
-        
-        total_wins = sum(r['wins'] for r in all_results)
-        total_losses = sum(r['losses'] for r in all_results)
-        total_draws = sum(r['draws'] for r in all_results)
-        total_games = sum(r['num_games'] for r in all_results)
+                print(f"🎲 Seed {seed_idx + 1}/{num_seeds} (seed={seed_results['seed']})")
+                print(f"  Win: {seed_results['wins']}/{num_games} ({seed_results['win_rate']:.1f}%)")
         
         # Logger l'évaluation
         self.logger.log_evaluation(
-            total_games, total_wins, total_losses, total_draws,
+            results['num_games'], results['wins'], results['losses'], results['draws'],
             agent_config=self.agent.get_stats()
         )
         
         # Afficher les résultats
         if verbose:
-            print(f"\n📊 Résultats agrégés ({num_seeds} seed(s)):")
-            print(f"  Victoires: {total_wins}/{total_games} ({avg_win_rate:.1f}%)", end="")
+            total_games = results['num_games']
+            avg_win_rate = results['win_rate']
+            std_win_rate = results['win_rate_std']
+            win_line = f"  Victoires: {results['wins']}/{total_games} ({avg_win_rate:.1f}%)"
             if num_seeds > 1:
-                print(f" ± {std_win_rate:.1f}%")
-            else:
-                print()
-            print(f"  Défaites: {total_losses}/{total_games} ({avg_loss_rate:.1f}%)")
-            print(f"  Nuls: {total_draws}/{total_games} ({avg_draw_rate:.1f}%)")
-            print(f"  Durée totale: {overall_duration:.2f}s")
-            print(f"  Vitesse: {total_games/overall_duration:.0f} parties/s")
+                win_line += f" ± {std_win_rate:.1f}%"
+            report = [
+                f"\n📊 Résultats agrégés ({num_seeds} seed(s)):",
+                win_line,
+                f"  Défaites: {results['losses']}/{total_games} ({results['loss_rate']:.1f}%)",
+                f"  Nuls: {results['draws']}/{total_games} ({results['draw_rate']:.1f}%)",
+                f"  Durée totale: {results['duration']:.2f}s",
+                f"  Vitesse: {total_games/results['duration']:.0f} parties/s",
+            ]
             
             if num_seeds > 1:
-                print(f"\n📈 Robustesse:")
-                print(f"  Min Win Rate: {min(win_rates):.1f}%")
-                print(f"  Max Win Rate: {max(win_rates):.1f}%")
-                print(f"  Écart-type: {std_win_rate:.1f}%")
-                
                 # Coefficient de variation (pour évaluer la stabilité)
                 cv = (std_win_rate / avg_win_rate * 100) if avg_win_rate > 0 else 0
                 stability = "Très stable" if cv < 2 else "Stable" if cv < 5 else "Variable"
-                print(f"  Stabilité: {stability} (CV={cv:.1f}%)")
+                report += [
+                    "\n📈 Robustesse:",
+                    f"  Min Win Rate: {results['win_rate_min']:.1f}%",
+                    f"  Max Win Rate: {results['win_rate_max']:.1f}%",
+                    f"  Écart-type: {std_win_rate:.1f}%",
+                    f"  Stabilité: {stability} (CV={cv:.1f}%)",
+                ]
             
-            print(f"{'='*70}\n")
+            report.append(f"{SEP}\n")
+            _write_report(report)
         
-        return {
+        return results
+    
+    def _evaluate_core(self, num_games: int, epsilon: float,
+                       num_seeds: int) -> Tuple[Dict, np.ndarray, np.ndarray]:
+        """
+        Joue les parties d'évaluation et calcule les taux, sans affichage ni logging.
+        
+        Args:
+            num_games: Nombre de parties à jouer par seed
+            epsilon: Taux d'exploration pour l'évaluation
+            num_seeds: Nombre de seeds différentes
+        
+        Returns:
+            (statistiques agrégées comme evaluate(), gagnants et nombres de coups
+            par partie sous forme de tableaux [num_seeds, num_games])
+        """
+        # Sauvegarder et modifier l'epsilon (et le générateur, remplacé par seed)
+        original_epsilon = self.agent.epsilon
+        original_rng = self.agent.rng
+        self.agent.set_epsilon(epsilon)
+        
+        winners = np.zeros((num_seeds, num_games), dtype=np.int8)
+        moves = np.zeros((num_seeds, num_games), dtype=np.int8)
+        durations = []
+        
+        overall_start_time = time.time()
+        
+        # Q-table figée pendant l'évaluation : politique gloutonne calculée une fois
+        policy = self.agent.get_policy_table() if isinstance(self.opponent, RandomAgent) else None
+        
+        # Chemin rapide: toutes les parties (seeds x parties) jouées en une fois
+        # par le noyau parallèle, à partir de tirages reproductibles par seed
+        if kernels.NUMBA_AVAILABLE and isinstance(self.opponent, RandomAgent):
+            kernels.pre_compile()
+            uniforms = np.concatenate([
+                np.random.default_rng(42 + seed_idx).random(
+                    (num_games, kernels.EVAL_UNIFORMS_PER_GAME))
+                for seed_idx in range(num_seeds)
+            ])
+            batch_winners, batch_moves = kernels.batched_eval(
+                self.agent.q_values, policy, epsilon, uniforms, num_games)
+            winners[:] = batch_winners.reshape(num_seeds, num_games)
+            moves[:] = batch_moves.reshape(num_seeds, num_games)
+            # Durée répartie : les seeds sont jouées ensemble
+            durations = [(time.time() - overall_start_time) / num_seeds] * num_seeds
+        elif isinstance(self.opponent, RandomAgent):
+            # Chaque seed est jouée par lot (BatchedTicTacToeEnv), avec les mêmes
+            # tirages que le noyau Numba ; seeds indépendantes (Q-table figée) :
+            # une par processus pour les très grosses évaluations
+            tasks = [(epsilon, 42 + seed_idx, num_games) for seed_idx in range(num_seeds)]
+            num_processes = min(num_seeds, os.cpu_count() or 1)
+            if num_processes > 1 and num_games * num_seeds >= EVAL_POOL_MIN_GAMES:
+                seed_runs = self._evaluate_seeds_shared(tasks, policy, num_processes)
+            else:
+                seed_runs = [_eval_one_seed(self.agent.q_values, policy, *task)
+                             for task in tasks]
+            for seed_idx, (_, seed_winners, seed_moves, duration) in enumerate(seed_runs):
+                winners[seed_idx] = seed_winners
+                moves[seed_idx] = seed_moves
+                durations.append(duration)
+        else:
+            for seed_idx in range(num_seeds):
+                # Générateur dédié à chaque seed (aucun état aléatoire global modifié)
+                seed = 42 + seed_idx  # Seeds reproductibles : 42, 43, 44, ...
+                self.agent.rng = random.Random(seed)
+                opponent = self.opponent
+                
+                start_time = time.time()
+                for game in range(num_games):
+                    winner, num_moves = self._play_episode_eval(game % 2 == 0, opponent)
+                    winners[seed_idx, game] = winner or 0
+                    moves[seed_idx, game] = num_moves
+                durations.append(time.time() - start_time)
+        
+        # Restaurer l'epsilon et le générateur
+        self.agent.set_epsilon(original_epsilon)
+        self.agent.rng = original_rng
+        
+        overall_duration = time.time() - overall_start_time
+        
+        # Issues du point de vue de l'agent (il joue X aux parties paires)
+        agent_starts = (np.arange(num_games) % 2 == 0).astype(np.intp)
+        outcomes = _OUTCOME_LUT[agent_starts, winners.astype(np.intp) + 1]
+        seed_counts = np.stack([(outcomes == k).sum(axis=1) for k in (_WIN, _LOSS, _DRAW)],
+                               axis=1)
+        
+        # Calculer les statistiques agrégées (une ligne par seed : victoires, défaites, nuls)
+        # float64 : les taux restent sérialisables en JSON dans les métadonnées
+        rates = seed_counts / num_games * 100
+        avg_win_rate, avg_loss_rate, avg_draw_rate = rates.mean(axis=0).tolist()
+        
+        # Résultats pour chaque seed, avec les statistiques de robustesse
+        # du taux de victoire accumulées seed par seed
+        win_rate_stats = OnlineStats()
+        all_results = []
+        for seed_idx, (wins, losses, draws) in enumerate(seed_counts.tolist()):
+            win_rate_stats.push(wins / num_games * 100)
+            all_results.append({
+                'seed': 42 + seed_idx,
+                'wins': wins,
+                'losses': losses,
+                'draws': draws,
+                'num_games': num_games,
+                'win_rate': wins / num_games * 100,
+                'loss_rate': losses / num_games * 100,
+                'draw_rate': draws / num_games * 100,
+                'duration': durations[seed_idx]
+            })
+        
+        total_wins, total_losses, total_draws = seed_counts.sum(axis=0).tolist()
+        
+        results = {
             'wins': total_wins,
             'losses': total_losses,
             'draws': total_draws,
-            'num_games': total_games,
+            'num_games': num_games * num_seeds,
             'win_rate': avg_win_rate,
             'loss_rate': avg_loss_rate,
             'draw_rate': avg_draw_rate,
             'duration': overall_duration,
             # Statistiques de robustesse (multi-seed)
             'num_seeds': num_seeds,
-            'win_rate_std': std_win_rate,
-            'win_rate_min': min(win_rates),
-            'win_rate_max': max(win_rates),
+            'win_rate_std': win_rate_stats.std,
+            'win_rate_min': win_rate_stats.mn,
+            'win_rate_max': win_rate_stats.mx,
             'all_seed_results': all_results  # Détails par seed
         }
-
+        return results, winners, moves
+    
+    def _evaluate_seeds_shared(self, tasks, policy: np.ndarray, num_processes: int):
+        """
+        Répartit les seeds sur un pool de processus. La Q-table est copiée
+        une fois dans un segment de mémoire partagée auquel chaque worker
+        s'attache au démarrage, au lieu d'être sérialisée avec chaque tâche.
+        
+        Args:
+            tasks: (epsilon, seed, num_games) pour chaque seed
+            policy: Politique gloutonne précalculée
+            num_processes: Nombre de workers
+        
+        Returns:
+            Résultats de _eval_one_seed, dans l'ordre des tâches
+        """
+        q_values = self.agent.q_values
+        shm = shared_memory.SharedMemory(create=True, size=q_values.nbytes)
+        try:
+            shared_q = np.ndarray(q_values.shape, dtype=q_values.dtype, buffer=shm.buf)
+            shared_q[:] = q_values
+            del shared_q  # Aucune vue ne doit subsister avant shm.close()
+            with multiprocessing.Pool(num_processes, initializer=_attach_eval_tables,
+                                      initargs=(shm.name, q_values.shape,
+                                                q_values.dtype.str, policy)) as pool:
+                return pool.map(_eval_seed_worker, tasks)
+        finally:
+            shm.close()
+            shm.unlink()
     
     def _print_progress(self, episode: int, total_episodes: int):
         """Affiche la progression de l'entraînement"""
-        total = self.wins + self.losses + self.draws
-        if total == 0:
+        if self._num_recorded == 0:
             return
         
-        win_rate = self.wins / total * 100
-        loss_rate = self.losses / total * 100
-        draw_rate = self.draws / total * 100
+        win_rate, loss_rate, draw_rate = _outcome_rates(self._results)
         
         # Statistiques sur les 1000 derniers épisodes
-        recent_length = min(1000, len(self.episode_lengths))
-        avg_length = sum(self.episode_lengths[-recent_length:]) / recent_length
-        avg_reward = sum(self.episode_rewards[-recent_length:]) / recent_length
-        
-        print(f"\n{'─'*70}")
-        print(f"Épisode {episode}/{total_episodes} ({episode/total_episodes*100:.1f}%)")
-        print(f"{'─'*70}")
-        print(f"Exploration:")
-        print(f"  Epsilon: {self.agent.epsilon:.6f}")
-        print(f"  États appris: {len(self.agent.q_table)}")
-        print(f"\nPerformances globales:")
-        print(f"  Victoires: {self.wins} ({win_rate:.1f}%)")
-        print(f"  Défaites: {self.losses} ({loss_rate:.1f}%)")
-        print(f"  Nuls: {self.draws} ({draw_rate:.1f}%)")
-        print(f"\nStatistiques (derniers {recent_length} épisodes):")
-        print(f"  Récompense moyenne: {avg_reward:.3f}")
-        print(f"  Longueur moyenne: {avg_length:.1f} coups")
-        print(f"{'─'*70}")
+        recent_length = len(self._recent_lengths)
+        avg_length = sum(self._recent_lengths) / recent_length
+        avg_reward = sum(self._recent_rewards) / recent_length
+        
+        _write_report([
+            "\n" + THIN_SEP,
+            f"Épisode {episode}/{total_episodes} ({episode/total_episodes*100:.1f}%)",
+            THIN_SEP,
+            "Exploration:",
+            f"  Epsilon: {self.agent.epsilon:.6f}",
+            f"  États appris: {self.agent.states_learned}",
+            "\nPerformances globales:",
+            f"  Victoires: {self.wins} ({win_rate:.1f}%)",
+            f"  Défaites: {self.losses} ({loss_rate:.1f}%)",
+            f"  Nuls: {self.draws} ({draw_rate:.1f}%)",
+            f"\nStatistiques (derniers {recent_length} épisodes):",
+            f"  Récompense moyenne: {avg_reward:.3f}",
+            f"  Longueur moyenne: {avg_length:.1f} coups",
+            THIN_SEP,
+        ])
     
     def _log_progress(self, episode: int):
         """Enregistre la progression dans le logger"""
-        total = self.wins + self.losses + self.draws
-        if total == 0:
+        if self._num_recorded == 0:
             return
         
-        win_rate = self.wins / total * 100
-        loss_rate = self.losses / total * 100
-        draw_rate = self.draws / total * 100
+        win_rate, loss_rate, draw_rate = _outcome_rates(self._results)
         
-        recent_length = min(100, len(self.episode_lengths))
-        avg_reward = sum(self.episode_rewards[-recent_length:]) / recent_length
-        avg_moves = sum(self.episode_lengths[-recent_length:]) / recent_length
+        recent = slice(max(0, self._num_recorded - 100), self._num_recorded)
+        avg_reward = float(self._rewards[recent].mean())
+        avg_moves = float(self._lengths[recent].mean())
         
         self.logger.log_training_step(
             episode=episode,
@@ -517,12 +1025,12 @@ class Trainer:
             draw_rate=draw_rate,
             avg_reward=avg_reward,
             avg_moves=avg_moves,
-            q_table_size=len(self.agent.q_table)
+            q_table_size=self.agent.states_learned
         )
     
     def _get_training_stats(self, num_episodes: int, duration: float) -> Dict:
         """Génère un rapport de fin d'entraînement"""
-        total = self.wins + self.losses + self.draws
+        win_rate, loss_rate, draw_rate = _outcome_rates(self._results)
         
         stats = {
             'num_episodes': num_episodes,
@@ -531,39 +1039,51 @@ class Trainer:
             'wins': self.wins,
             'losses': self.losses,
             'draws': self.draws,
-            'win_rate': self.wins / total * 100 if total > 0 else 0,
-            'loss_rate': self.losses / total * 100 if total > 0 else 0,
-            'draw_rate': self.draws / total * 100 if total > 0 else 0,
-            'avg_episode_length': sum(self.episode_lengths) / len(self.episode_lengths) if self.episode_lengths else 0,
-            'avg_reward': sum(self.episode_rewards) / len(self.episode_rewards) if self.episode_rewards else 0,
+            'win_rate': win_rate,
+            'loss_rate': loss_rate,
+            'draw_rate': draw_rate,
+            'avg_episode_length': self._length_sum / self._num_recorded if self._num_recorded else 0,
+            'avg_reward': self._reward_sum / self._num_recorded if self._num_recorded else 0,
             'final_epsilon': self.agent.epsilon,
-            'states_learned': len(self.agent.q_table)
+            'states_learned': self.agent.states_learned
         }
         
         # Afficher le résumé
-        print(f"\n{'='*70}")
-        print("ENTRAÎNEMENT TERMINÉ")
-        print(f"{'='*70}")
-        print(f"Épisodes: {stats['num_episodes']}")
-        print(f"Durée: {stats['duration']:.2f}s")
-        print(f"Vitesse: {stats['speed']:.0f} épisodes/s")
-        print(f"\nRésultats finaux:")
-        print(f"  Victoires: {stats['wins']} ({stats['win_rate']:.1f}%)")
-        print(f"  Défaites: {stats['losses']} ({stats['loss_rate']:.1f}%)")
-        print(f"  Nuls: {stats['draws']} ({stats['draw_rate']:.1f}%)")
-        print(f"\nApprentissage:")
-        print(f"  États appris: {stats['states_learned']}")
-        print(f"  Epsilon final: {stats['final_epsilon']:.6f}")
-        print(f"  Récompense moyenne: {stats['avg_reward']:.3f}")
-        print(f"  Longueur moyenne: {stats['avg_episode_length']:.1f} coups")
-        print(f"{'='*70}\n")
+        _write_report([
+            "\n" + SEP,
+            "ENTRAÎNEMENT TERMINÉ",
+            SEP,
+            f"Épisodes: {stats['num_episodes']}",
+            f"Durée: {stats['duration']:.2f}s",
+            f"Vitesse: {stats['speed']:.0f} épisodes/s",
+            "\nRésultats finaux:",
+            f"  Victoires: {stats['wins']} ({stats['win_rate']:.1f}%)",
+            f"  Défaites: {stats['losses']} ({stats['loss_rate']:.1f}%)",
+            f"  Nuls: {stats['draws']} ({stats['draw_rate']:.1f}%)",
+            "\nApprentissage:",
+            f"  États appris: {stats['states_learned']}",
+            f"  Epsilon final: {stats['final_epsilon']:.6f}",
+            f"  Récompense moyenne: {stats['avg_reward']:.3f}",
+            f"  Longueur moyenne: {stats['avg_episode_length']:.1f} coups",
+            SEP + "\n",
+        ])
         
         return stats
     
     def reset_stats(self):
         """Réinitialise les statistiques d'entraînement"""
-        self.episode_rewards = []
-        self.episode_lengths = []
-        self.wins = 0
-        self.losses = 0
-        self.draws = 0
+        self._rewards = np.empty(0, dtype=np.float32)
+        self._lengths = np.empty(0, dtype=np.int16)
+        if self.telemetry_dir is not None:
+            # Les projections sont libérées ci-dessus, les fichiers peuvent être supprimés
+            for filename in ("rewards.f32", "lengths.i16"):
+                try:
+                    (self.telemetry_dir / filename).unlink()
+                except OSError:
+                    pass  # Absent, ou encore ouvert ailleurs (Windows)
+        self._num_recorded = 0
+        self._reward_sum = 0.0
+        self._length_sum = 0
+        self._recent_rewards.clear()
+        self._recent_lengths.clear()
+        self._results[:] = 0
@@ -10,11 +10,30 @@ import matplotlib
 matplotlib.use('Agg')  # Backend pour pygame
 import matplotlib.pyplot as plt
 from io import BytesIO
+from functools import lru_cache
+from collections import deque, OrderedDict
+
+from .visualization_kernels import q_to_rgb
+
+
+@lru_cache(maxsize=256)
+def _cell_surface(color: Tuple[int, int, int], border_color: Tuple[int, int, int],
+                  cell_size: int) -> pygame.Surface:
+    """Case pleine avec sa bordure, rendue une seule fois par (couleur, taille)"""
+    surface = pygame.Surface((cell_size, cell_size))
+    surface.fill(color)
+    pygame.draw.rect(surface, border_color, surface.get_rect(), 2)
+    return surface
 
 
 class QTableVisualizer:
     """Visualise la Q-table sous forme de heatmap"""
     
+    # Nombre maximal de textes gardés en cache
+    TEXT_CACHE_SIZE = 1024
+    # Part de l'écran au-delà de laquelle un flip complet bat display.update(rects)
+    PARTIAL_UPDATE_MAX_AREA = 0.25
+    
     def __init__(self, screen: pygame.Surface, assets):
         """
         Initialise le visualiseur.
@@ -25,11 +44,49 @@ class QTableVisualizer:
         """
         self.screen = screen
         self.assets = assets
+        # Surfaces de texte déjà rendues, par (texte, taille de police, couleur)
+        self._text_cache: Dict[Tuple, pygame.Surface] = {}
+        # Tampons d'une case pour convertir une Q-value isolée (_q_value_to_color)
+        self._q_buffer = np.zeros(1, dtype=np.float32)
+        self._rgb_buffer = np.zeros((1, 3), dtype=np.uint8)
+        # Dernier (pion, Q-value) dessiné par case, et géométrie correspondante
+        self._last_cell_state: List[Optional[tuple]] = [None] * 9
+        self._last_geometry: Optional[Tuple[int, int, int]] = None
+        # Rectangles et centres des 9 cases, par (x_start, y_start, cell_size)
+        self._geom_cache: Dict[Tuple[int, int, int],
+                               Tuple[List[pygame.Rect], List[Tuple[int, int]]]] = {}
+    
+    def _render_text(self, text: str, font_size: str,
+                     color: Tuple[int, int, int]) -> pygame.Surface:
+        """Rend un texte une seule fois puis le réutilise (voir _text_cache)"""
+        key = (text, font_size, tuple(color))
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= self.TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            font = getattr(self.assets, f"font_{font_size}")
+            surface = self._text_cache[key] = font.render(text, True, color)
+        return surface
+    
+    @staticmethod
+    def _build_geom(x_start: int, y_start: int,
+                    cell_size: int) -> Tuple[List[pygame.Rect], List[Tuple[int, int]]]:
+        """Rectangles et centres des 9 cases du plateau, indexés par action"""
+        rects = [pygame.Rect(x_start + (action % 3) * cell_size,
+                             y_start + (action // 3) * cell_size, cell_size, cell_size)
+                 for action in range(9)]
+        return rects, [rect.center for rect in rects]
     
     def draw_q_values_for_state(self, board: np.ndarray, q_values: List[Tuple[int, float]],
-                                x_start: int = 50, y_start: int = 50, cell_size: int = 80):
+                                x_start: int = 50, y_start: int = 50, cell_size: int = 80,
+                                incremental: bool = False) -> List[pygame.Rect]:
         """
         Dessine les Q-values sur le plateau.
+        Par défaut les 9 cases sont redessinées à chaque appel. En mode
+        incrémental, seules les cases dont le pion ou la Q-value a changé
+        depuis l'appel précédent le sont : l'appelant ne doit alors pas
+        effacer la zone du plateau entre deux images, et affiche les
+        rectangles retournés (voir present).
         
         Args:
             board: Plateau de jeu (3x3)
@@ -37,94 +94,311 @@ class QTableVisualizer:
             x_start: Position X de départ
             y_start: Position Y de départ
             cell_size: Taille des cellules
+            incremental: Ne redessine que les cases modifiées
+        
+        Returns:
+            Rectangles des cases redessinées (pour pygame.display.update,
+            partagés entre les appels : ne pas les modifier)
         """
-        # Créer un dict pour accès rapide
-        q_dict = {action: q_val for action, q_val in q_values}
+        # Q-value par action (None si absente), indexée directement
+        q_arr: List[Optional[float]] = [None] * 9
+        for action, q_val in q_values:
+            q_arr[action] = q_val
+        
+        geometry = (x_start, y_start, cell_size)
+        rects, centers = self._geom_cache.get(geometry) or self._geom_cache.setdefault(
+            geometry, self._build_geom(x_start, y_start, cell_size))
+        if not incremental or geometry != self._last_geometry:
+            self._last_cell_state = [None] * 9
+            self._last_geometry = geometry
+        
+        border_color = tuple(self.assets.colors.TEXT_COLOR)
+        # Fonds de cases puis textes, envoyés en un seul appel à blits()
+        cell_blits = []
+        text_blits = []
+        dirty_rects = []
+        heat_colors = None
         
         # Dessiner le plateau
         for row in range(3):
             for col in range(3):
                 action = row * 3 + col
-                x = x_start + col * cell_size
-                y = y_start + row * cell_size
+                cell = int(board[row, col])
+                state = (cell, q_arr[action])
+                if state == self._last_cell_state[action]:
+                    continue
+                self._last_cell_state[action] = state
+                
+                rect = rects[action]
+                center = centers[action]
                 
                 # Fond de la cellule
-                if board[row, col] != 0:
+                if cell != 0:
                     # Case occupée - gris foncé
                     color = (60, 60, 60)
-                elif action in q_dict:
-                    # Couleur selon Q-value
-                    q_val = q_dict[action]
-                    color = self._q_value_to_color(q_val)
+                elif q_arr[action] is not None:
+                    # Couleurs des 9 cases calculées en un seul appel au noyau
+                    if heat_colors is None:
+                        q_array = np.array([0.0 if q is None else q for q in q_arr],
+                                           dtype=np.float32)
+                        heat_colors = self._colors_for_actions(q_array).tolist()
+                    color = tuple(heat_colors[action])
                 else:
                     color = (40, 40, 40)
                 
-                rect = pygame.Rect(x, y, cell_size, cell_size)
-                pygame.draw.rect(self.screen, color, rect)
-                pygame.draw.rect(self.screen, self.assets.colors.TEXT_COLOR, rect, 2)
+                cell_blits.append((_cell_surface(color, border_color, cell_size), rect))
+                dirty_rects.append(rect)
                 
                 # Afficher la Q-value si disponible
-                if action in q_dict and board[row, col] == 0:
-                    q_val = q_dict[action]
-                    text = f"{q_val:.3f}"
-                    self.assets.draw_text(
-                        self.screen,
-                        text,
-                        (x + cell_size // 2, y + cell_size // 2),
-                        font_size='tiny',
-                        centered=True
-                    )
+                q_val = q_arr[action]
+                if q_val is not None and cell == 0:
+                    # 2 décimales : peu de textes distincts, cache efficace
+                    text_surface = self._render_text(
+                        f"{q_val:+.2f}", 'tiny', self.assets.colors.TEXT_COLOR)
+                    text_blits.append((text_surface, text_surface.get_rect(center=center)))
                 
                 # Afficher X ou O si occupé
-                if board[row, col] == 1:
-                    self.assets.draw_text(
-                        self.screen,
-                        "X",
-                        (x + cell_size // 2, y + cell_size // 2),
-                        font_size='large',
-                        color=self.assets.colors.SUCCESS_COLOR,
-                        centered=True
-                    )
-                elif board[row, col] == -1:
-                    self.assets.draw_text(
-                        self.screen,
-                        "O",
-                        (x + cell_size // 2, y + cell_size // 2),
-                        font_size='large',
-                        color=self.assets.colors.ERROR_COLOR,
-                        centered=True
-                    )
+                if cell == 1:
+                    text_surface = self._render_text(
+                        "X", 'large', self.assets.colors.SUCCESS_COLOR)
+                    text_blits.append((text_surface, text_surface.get_rect(center=center)))
+                elif cell == -1:
+                    text_surface = self._render_text(
+                        "O", 'large', self.assets.colors.ERROR_COLOR)
+                    text_blits.append((text_surface, text_surface.get_rect(center=center)))
+        
+        if cell_blits:
+            self.screen.blits(cell_blits + text_blits, doreturn=False)
+        return dirty_rects
+    
+    def present(self, dirty_rects: List[pygame.Rect]):
+        """
+        Affiche à l'écran les cases redessinées par draw_q_values_for_state.
+        Mise à jour partielle si la zone est petite, flip complet sinon.
+        
+        Args:
+            dirty_rects: Rectangles retournés par draw_q_values_for_state
+        """
+        if not dirty_rects:
+            return
+        screen_area = self.screen.get_width() * self.screen.get_height()
+        dirty_area = sum(rect.width * rect.height for rect in dirty_rects)
+        if dirty_area < self.PARTIAL_UPDATE_MAX_AREA * screen_area:
+            pygame.display.update(dirty_rects)
+        else:
+            pygame.display.flip()
     
     def _q_value_to_color(self, q_value: float) -> Tuple[int, int, int]:
         """Convertit une Q-value en couleur (heatmap)"""
-        # Normaliser entre 0 et 1 (supposer Q entre -1 et 1)
-        normalized = (q_value + 1) / 2
-        normalized = max(0, min(1, normalized))
-        
-        # Gradient vert -> jaune -> rouge
-        if normalized > 0.5:
-            # Vert à jaune
-            t = (normalized - 0.5) * 2
-            r = int(255 * t)
-            g = 200
-            b = 0
-        else:
-            # Bleu à vert
-            t = normalized * 2
-            r = 0
-            g = int(200 * t)
-            b = int(150 * (1 - t))
+        self._q_buffer[0] = q_value
+        q_to_rgb(self._q_buffer, self._rgb_buffer)
+        return tuple(self._rgb_buffer[0].tolist())
+    
+    def _colors_for_actions(self, q_array: np.ndarray) -> np.ndarray:
+        """
+        Convertit un tableau de Q-values en couleurs en un seul appel au noyau.
+        
+        Args:
+            q_array: Q-values (forme quelconque)
         
-        return (r, g, b)
+        Returns:
+            Couleurs RGB uint8, forme q_array.shape + (3,)
+        """
+        q_array = np.asarray(q_array, dtype=np.float32)
+        colors = np.empty((q_array.size, 3), dtype=np.uint8)
+        q_to_rgb(q_array.ravel(), colors)
+        return colors.reshape(q_array.shape + (3,))
+
+
+class _ReusableBuffer(BytesIO):
+    """BytesIO qui survit à image.load (pygame ferme le fichier après lecture)"""
+    
+    def close(self):
+        pass
 
 
 class TrainingGraphs:
-    """Génère des graphiques d'entraînement"""
+    """
+    Génère des graphiques d'entraînement.
+    Rendu direct avec pygame.draw par défaut ; matplotlib (plus lent, PNG
+    intermédiaire) reste disponible avec use_matplotlib=True pour l'export.
+    """
+    
+    BACKGROUND = (45, 45, 45)  # #2d2d2d, comme le fond des figures matplotlib
+    GRID_COLOR = (80, 80, 80)
+    TEXT_COLOR = (230, 230, 230)
+    PADDING = 60
+    # Graphique vide partagé (voir _empty_surface) : ne pas dessiner dessus
+    _EMPTY_SURFACE: Optional[pygame.Surface] = None
+    # Figures matplotlib réutilisées d'un rendu à l'autre (créées au premier appel)
+    _PROGRESS_FIG = None
+    _PROGRESS_AXES = None
+    _COMPARISON_FIG = None
+    _COMPARISON_AX = None
+    # Tampon PNG partagé entre savefig et image.load (voir _png_buffer)
+    _PNG_BUF = _ReusableBuffer()
+    
+    @staticmethod
+    def _font(size: int) -> pygame.font.Font:
+        """Police par défaut de pygame (initialise le module si besoin)"""
+        if not pygame.font.get_init():
+            pygame.font.init()
+        return pygame.font.Font(None, size)
+    
+    @staticmethod
+    def _polyline(data, x: int, y: int, width: int, height: int,
+                  min_val: float, max_val: float) -> List[Tuple[int, int]]:
+        """Points d'une courbe normalisée dans le cadre (x, y, width, height)"""
+        values = np.asarray(data, dtype=np.float64)
+        span = (max_val - min_val) or 1.0
+        norm = np.clip((values - min_val) / span, 0.0, 1.0)
+        xs = x + np.linspace(0, width, values.size)
+        ys = y + height - norm * height
+        return np.column_stack([xs, ys]).astype(np.int32).tolist()
+    
+    @staticmethod
+    def _draw_panel(surface: pygame.Surface, rect: pygame.Rect, data,
+                    color: Tuple[int, int, int], label: str,
+                    min_val: float, max_val: float, font: pygame.font.Font):
+        """Cadre, grille, courbe et étiquette d'un panneau de graphique"""
+        pygame.draw.rect(surface, TrainingGraphs.GRID_COLOR, rect, 1)
+        for i in range(1, 4):
+            grid_y = rect.y + rect.height * i // 4
+            pygame.draw.line(surface, TrainingGraphs.GRID_COLOR,
+                             (rect.x, grid_y), (rect.right, grid_y))
+        if len(data) >= 2:
+            points = TrainingGraphs._polyline(data, rect.x, rect.y, rect.width,
+                                              rect.height, min_val, max_val)
+            pygame.draw.lines(surface, color, False, points, 2)
+        surface.blit(font.render(label, True, color), (rect.x, rect.y - 22))
+        surface.blit(font.render(f"{max_val:g}", True, TrainingGraphs.TEXT_COLOR),
+                     (rect.x - 45, rect.y - 6))
+        surface.blit(font.render(f"{min_val:g}", True, TrainingGraphs.TEXT_COLOR),
+                     (rect.x - 45, rect.bottom - 10))
+    
+    @staticmethod
+    def _render_native(episode_data: List[int], win_rate_data: List[float],
+                       epsilon_data: List[float]) -> pygame.Surface:
+        """Graphique de progression dessiné directement avec pygame (800x600)"""
+        width, height, pad = 800, 600, TrainingGraphs.PADDING
+        surface = pygame.Surface((width, height))
+        surface.fill(TrainingGraphs.BACKGROUND)
+        font = TrainingGraphs._font(22)
+        
+        title = TrainingGraphs._font(28).render("Progression de l'entraînement", True,
+                                                TrainingGraphs.TEXT_COLOR)
+        surface.blit(title, title.get_rect(center=(width // 2, 20)))
+        
+        panel_height = (height - 3 * pad) // 2
+        win_rect = pygame.Rect(pad, pad, width - 2 * pad, panel_height)
+        eps_rect = pygame.Rect(pad, 2 * pad + panel_height, width - 2 * pad, panel_height)
+        max_win = max(100.0, max(win_rate_data, default=0.0))
+        max_eps = max(1.0, max(epsilon_data, default=0.0))
+        TrainingGraphs._draw_panel(surface, win_rect, win_rate_data, (0, 200, 0),
+                                   "Win Rate (%)", 0.0, max_win, font)
+        TrainingGraphs._draw_panel(surface, eps_rect, epsilon_data, (60, 120, 255),
+                                   "Epsilon", 0.0, max_eps, font)
+        
+        if episode_data:
+            last = font.render(f"Épisodes: {episode_data[0]} - {episode_data[-1]}", True,
+                               TrainingGraphs.TEXT_COLOR)
+            surface.blit(last, last.get_rect(center=(width // 2, height - 20)))
+        return TrainingGraphs._to_display_format(surface)
+    
+    @staticmethod
+    def _to_display_format(surface: pygame.Surface) -> pygame.Surface:
+        """
+        Convertit la surface au format de pixels de l'écran, pour que ses
+        blits ultérieurs soient de simples copies. Sans fenêtre (tests,
+        mode headless), la surface est rendue telle quelle.
+        """
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            return surface.convert()
+        return surface
+    
+    @staticmethod
+    def _png_buffer() -> BytesIO:
+        """
+        Vide et retourne le tampon PNG partagé. Sans risque : image.load
+        copie les pixels dans la surface créée.
+        """
+        buf = TrainingGraphs._PNG_BUF
+        buf.seek(0)
+        buf.truncate()
+        return buf
+    
+    @staticmethod
+    def _reset_layout(fig):
+        """Remet les marges par défaut : tight_layout repart du même état à chaque rendu"""
+        fig.subplots_adjust(**{key: matplotlib.rcParams[f'figure.subplot.{key}']
+                               for key in ('left', 'right', 'bottom', 'top',
+                                           'wspace', 'hspace')})
+    
+    @staticmethod
+    def _empty_surface() -> pygame.Surface:
+        """Graphique "Aucune donnée" (800x600), rendu une seule fois puis partagé"""
+        if TrainingGraphs._EMPTY_SURFACE is None:
+            surface = pygame.Surface((800, 600))
+            surface.fill(TrainingGraphs.BACKGROUND)
+            text = TrainingGraphs._font(32).render('Aucune donnée', True,
+                                                   TrainingGraphs.TEXT_COLOR)
+            surface.blit(text, text.get_rect(center=(400, 300)))
+            TrainingGraphs._EMPTY_SURFACE = surface
+        return TrainingGraphs._EMPTY_SURFACE
+    
+    @staticmethod
+    def _render_bars_native(models_data: List[Dict]) -> pygame.Surface:
+        """Barres horizontales des scores composites dessinées avec pygame"""
+        if not models_data:
+            return TrainingGraphs._empty_surface()
+        
+        width, height, pad = 1000, 600, TrainingGraphs.PADDING
+        surface = pygame.Surface((width, height))
+        surface.fill(TrainingGraphs.BACKGROUND)
+        font = TrainingGraphs._font(22)
+        
+        title = TrainingGraphs._font(28).render('Comparaison des Modèles', True,
+                                                TrainingGraphs.TEXT_COLOR)
+        surface.blit(title, title.get_rect(center=(width // 2, 20)))
+        
+        top = models_data[:10]  # Top 10
+        label_width = 160
+        plot = pygame.Rect(pad + label_width, pad, width - 2 * pad - label_width,
+                           height - 2 * pad)
+        max_score = max(100.0, max(m.get('composite_score', 0) for m in top))
+        bar_slot = plot.height / len(top)
+        
+        for i in range(1, 5):
+            grid_x = plot.x + plot.width * i // 4
+            pygame.draw.line(surface, TrainingGraphs.GRID_COLOR,
+                             (grid_x, plot.y), (grid_x, plot.bottom))
+        
+        for i, model in enumerate(top):
+            score = model.get('composite_score', 0)
+            # Colorer selon le score
+            if score >= 80:
+                color = (0, 160, 0)
+            elif score >= 60:
+                color = (255, 165, 0)
+            else:
+                color = (220, 40, 40)
+            bar_y = int(plot.y + i * bar_slot + bar_slot * 0.1)
+            bar_width = int(plot.width * max(0.0, score) / max_score)
+            pygame.draw.rect(surface, color,
+                             (plot.x, bar_y, bar_width, int(bar_slot * 0.8)))
+            label = font.render(model['name'][:15], True, TrainingGraphs.TEXT_COLOR)
+            surface.blit(label, label.get_rect(
+                midright=(plot.x - 8, int(bar_y + bar_slot * 0.4))))
+        
+        axis = font.render('Score Composite', True, TrainingGraphs.TEXT_COLOR)
+        surface.blit(axis, axis.get_rect(center=(plot.centerx, height - 20)))
+        return TrainingGraphs._to_display_format(surface)
     
     @staticmethod
     def create_training_progress_graph(episode_data: List[int], 
                                       win_rate_data: List[float],
-                                      epsilon_data: List[float]) -> pygame.Surface:
+                                      epsilon_data: List[float],
+                                      use_matplotlib: bool = False) -> pygame.Surface:
         """
         Crée un graphique de progression d'entraînement.
         
@@ -132,11 +406,22 @@ class TrainingGraphs:
             episode_data: Numéros d'épisodes
             win_rate_data: Win rates correspondants
             epsilon_data: Epsilons correspondants
+            use_matplotlib: Rendu matplotlib (export) au lieu du rendu pygame
         
         Returns:
             Surface Pygame avec le graphique
         """
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(8, 6))
+        if not use_matplotlib:
+            return TrainingGraphs._render_native(episode_data, win_rate_data, epsilon_data)
+        
+        # Figure créée une seule fois, axes vidés à chaque rendu
+        if TrainingGraphs._PROGRESS_FIG is None:
+            TrainingGraphs._PROGRESS_FIG, TrainingGraphs._PROGRESS_AXES = plt.subplots(
+                2, 1, figsize=(8, 6))
+        fig, (ax1, ax2) = TrainingGraphs._PROGRESS_FIG, TrainingGraphs._PROGRESS_AXES
+        ax1.cla()
+        ax2.cla()
+        TrainingGraphs._reset_layout(fig)
         
         # Win rate
         ax1.plot(episode_data, win_rate_data, 'g-', linewidth=2, label='Win Rate')
@@ -153,45 +438,44 @@ class TrainingGraphs:
         ax2.tick_params(axis='y', labelcolor='b')
         ax2.grid(True, alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Convertir en surface Pygame
-        buf = BytesIO()
-        plt.savefig(buf, format='png', dpi=100, facecolor='#2d2d2d', edgecolor='none')
+        buf = TrainingGraphs._png_buffer()
+        fig.savefig(buf, format='png', dpi=100, facecolor='#2d2d2d', edgecolor='none')
         buf.seek(0)
         
-        surface = pygame.image.load(buf)
-        plt.close()
-        
-        return surface
+        return TrainingGraphs._to_display_format(pygame.image.load(buf))
     
     @staticmethod
-    def create_metrics_comparison_chart(models_data: List[Dict]) -> pygame.Surface:
+    def create_metrics_comparison_chart(models_data: List[Dict],
+                                        use_matplotlib: bool = False) -> pygame.Surface:
         """
         Crée un graphique de comparaison des modèles.
         
         Args:
             models_data: Liste de dictionnaires avec les métriques
+            use_matplotlib: Rendu matplotlib (export) au lieu du rendu pygame
         
         Returns:
             Surface Pygame avec le graphique
         """
+        if not use_matplotlib:
+            return TrainingGraphs._render_bars_native(models_data)
+        
         if not models_data:
-            # Image vide
-            fig = plt.figure(figsize=(8, 6))
-            plt.text(0.5, 0.5, 'Aucune donnée', ha='center', va='center')
-            buf = BytesIO()
-            plt.savefig(buf, format='png', dpi=100)
-            buf.seek(0)
-            surface = pygame.image.load(buf)
-            plt.close()
-            return surface
+            return TrainingGraphs._empty_surface()
         
         # Graphique en barres
         names = [m['name'][:15] for m in models_data[:10]]  # Top 10
         scores = [m.get('composite_score', 0) for m in models_data[:10]]
         
-        fig, ax = plt.subplots(figsize=(10, 6))
+        if TrainingGraphs._COMPARISON_FIG is None:
+            TrainingGraphs._COMPARISON_FIG, TrainingGraphs._COMPARISON_AX = plt.subplots(
+                figsize=(10, 6))
+        fig, ax = TrainingGraphs._COMPARISON_FIG, TrainingGraphs._COMPARISON_AX
+        ax.cla()
+        TrainingGraphs._reset_layout(fig)
         bars = ax.barh(names, scores, color='skyblue')
         
         # Colorer selon le score
@@ -207,21 +491,21 @@ class TrainingGraphs:
         ax.set_title('Comparaison des Modèles')
         ax.grid(axis='x', alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
-        buf = BytesIO()
-        plt.savefig(buf, format='png', dpi=100, facecolor='#2d2d2d', edgecolor='none')
+        buf = TrainingGraphs._png_buffer()
+        fig.savefig(buf, format='png', dpi=100, facecolor='#2d2d2d', edgecolor='none')
         buf.seek(0)
         
-        surface = pygame.image.load(buf)
-        plt.close()
-        
-        return surface
+        return TrainingGraphs._to_display_format(pygame.image.load(buf))
 
 
 class RealtimeTrainingVisualization:
     """Visualisation en temps réel pendant l'entraînement"""
     
+    # Nombre de légendes gardées en cache
+    LEGEND_CACHE_SIZE = 16
+    
     def __init__(self, screen: pygame.Surface, assets):
         """
         Initialise la visualisation en temps réel.
@@ -232,10 +516,13 @@ class RealtimeTrainingVisualization:
         """
         self.screen = screen
         self.assets = assets
-        self.episode_history = []
-        self.win_rate_history = []
-        self.epsilon_history = []
         self.max_points = 100  # Garder les 100 derniers points
+        # Tampons circulaires: les plus anciens points sont évincés en O(1)
+        self.episode_history = deque(maxlen=self.max_points)
+        self.win_rate_history = deque(maxlen=self.max_points)
+        self.epsilon_history = deque(maxlen=self.max_points)
+        # Légendes déjà rendues, par texte affiché (LRU)
+        self._legend_cache: OrderedDict = OrderedDict()
     
     def update(self, episode: int, win_rate: float, epsilon: float):
         """
@@ -249,12 +536,6 @@ class RealtimeTrainingVisualization:
         self.episode_history.append(episode)
         self.win_rate_history.append(win_rate)
         self.epsilon_history.append(epsilon)
-        
-        # Limiter la taille
-        if len(self.episode_history) > self.max_points:
-            self.episode_history.pop(0)
-            self.win_rate_history.pop(0)
-            self.epsilon_history.pop(0)
     
     def draw(self, x: int = 50, y: int = 50, width: int = 500, height: int = 300):
         """
@@ -288,31 +569,29 @@ class RealtimeTrainingVisualization:
             0, 1  # Min/max
         )
         
-        # Légende
-        self.assets.draw_text(
-            self.screen,
-            f"Win Rate: {self.win_rate_history[-1]:.1f}% | Epsilon: {self.epsilon_history[-1]:.4f}",
-            (x + width // 2, y - 15),
-            font_size='tiny',
-            centered=True
-        )
+        # Légende (rendue seulement quand le texte affiché change)
+        legend = self._legend_surface(
+            f"Win Rate: {self.win_rate_history[-1]:.1f}% | Epsilon: {self.epsilon_history[-1]:.4f}")
+        self.screen.blit(legend, legend.get_rect(center=(x + width // 2, y - 15)))
+    
+    def _legend_surface(self, text: str) -> pygame.Surface:
+        """Surface de la légende, prise dans le cache LRU si déjà rendue"""
+        surface = self._legend_cache.get(text)
+        if surface is not None:
+            self._legend_cache.move_to_end(text)
+            return surface
+        surface = self.assets.font_tiny.render(text, True, self.assets.colors.TEXT_COLOR)
+        self._legend_cache[text] = surface
+        if len(self._legend_cache) > self.LEGEND_CACHE_SIZE:
+            self._legend_cache.popitem(last=False)
+        return surface
     
-    def _draw_line_graph(self, data: List[float], x: int, y: int, 
+    def _draw_line_graph(self, data, x: int, y: int, 
                         width: int, height: int, color: Tuple[int, int, int],
                         min_val: float, max_val: float):
-        """Dessine une ligne de graphique"""
+        """Dessine une ligne de graphique (points calculés en bloc par NumPy)"""
         if len(data) < 2:
             return
         
-        points = []
-        for i, value in enumerate(data):
-            # Normaliser
-            normalized = (value - min_val) / (max_val - min_val)
-            normalized = max(0, min(1, normalized))
-            
-            px = x + (i / (len(data) - 1)) * width
-            py = y + height - (normalized * height)
-            points.append((px, py))
-        
-        if len(points) >= 2:
-            pygame.draw.lines(self.screen, color, False, points, 2)
+        points = TrainingGraphs._polyline(data, x, y, width, height, min_val, max_val)
+        pygame.draw.lines(self.screen, color, False, points, 2)
@@ -0,0 +1,43 @@
+"""
+Noyaux numériques compilés (Numba) pour la visualisation
+Conversion Q-value -> couleur de la heatmap, appliquée élément par élément
+dans une boucle compilée. Même repli Python pur que rl_logic.kernels.
+"""
+
+import numpy as np
+
+from .kernels import njit, NUMBA_AVAILABLE
+
+
+@njit(cache=True, boundscheck=False)
+def q_to_rgb(q, out):
+    """
+    Remplit out (N, 3) uint8 avec la couleur de chaque Q-value de q (N,)
+    Dégradé quantifié sur 256 niveaux (Q supposée entre -1 et 1) :
+    bleu -> vert -> jaune.
+    """
+    for i in range(q.shape[0]):
+        level = int((q[i] + 1.0) * 127.5)
+        if level < 0:
+            level = 0
+        elif level > 255:
+            level = 255
+        normalized = level / 255.0
+        if normalized > 0.5:
+            # Vert à jaune
+            t = (normalized - 0.5) * 2.0
+            out[i, 0] = np.uint8(255.0 * t)
+            out[i, 1] = 200
+            out[i, 2] = 0
+        else:
+            # Bleu à vert
+            t = normalized * 2.0
+            out[i, 0] = 0
+            out[i, 1] = np.uint8(200.0 * t)
+            out[i, 2] = np.uint8(150.0 * (1.0 - t))
+
+
+# Compilation à l'import (ou lecture du cache disque) plutôt qu'au premier
+# affichage de la heatmap
+if NUMBA_AVAILABLE:
+    q_to_rgb(np.zeros(1, dtype=np.float32), np.empty((1, 3), dtype=np.uint8))
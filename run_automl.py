@@ -2,9 +2,14 @@
 Script pour lancer l'AutoML - Hyperparameter Tuning
 """
 
+import os
 from rl_logic.automl import AutoMLTuner
 from engine.environment import TicTacToeEnvironment
 
+def _num_workers(requested: int, total_configs: int) -> int:
+    """Processus demandés, sans dépasser le nombre de cœurs ni de configurations"""
+    return max(1, min(requested, os.cpu_count() or 1, total_configs))
+
 def main():
     print("🤖 AUTOML - Optimisation Automatique des Hyperparamètres")
     print("=" * 70 + "\n")
@@ -21,6 +26,8 @@ def main():
     
     episodes = int(input("Épisodes d'entraînement par config (défaut: 10000): ") or "10000")
     eval_games = int(input("Parties d'évaluation (défaut: 100): ") or "100")
+    # En parallèle, chaque config écrit dans models/automl/config_<id>/ (pas dans models/)
+    workers = int(input(f"Processus en parallèle (défaut: 1, cœurs: {os.cpu_count() or 1}): ") or "1")
     
     if choice == "1":
         # Grid Search complet
@@ -31,11 +38,12 @@ def main():
         }
         
         total = 5 * 5 * 4  # 100 configurations
+        n_workers = _num_workers(workers, total)
         print(f"\n⚠️  Cela va tester {total} configurations!")
-        print(f"⏱️  Temps estimé: ~{total * episodes / 2000:.0f} minutes")
+        print(f"⏱️  Temps estimé: ~{total * episodes / 2000 / n_workers:.0f} minutes ({n_workers} processus)")
         
         if input("Continuer? (o/n): ").lower() == 'o':
-            result = tuner.grid_search(param_grid, episodes, eval_games)
+            result = tuner.grid_search(param_grid, episodes, eval_games, n_workers=n_workers)
     
     elif choice == "2":
         # Random Search
@@ -48,11 +56,13 @@ def main():
         
         n_iter = int(input("Nombre d'itérations (défaut: 20): ") or "20")
         
+        n_workers = _num_workers(workers, n_iter)
         print(f"\n⚠️  Cela va tester {n_iter} configurations aléatoires")
-        print(f"⏱️  Temps estimé: ~{n_iter * episodes / 2000:.0f} minutes")
+        print(f"⏱️  Temps estimé: ~{n_iter * episodes / 2000 / n_workers:.0f} minutes ({n_workers} processus)")
         
         if input("Continuer? (o/n): ").lower() == 'o':
-            result = tuner.random_search(param_distributions, n_iter, episodes, eval_games)
+            result = tuner.random_search(param_distributions, n_iter, episodes, eval_games,
+                                         n_workers=n_workers)
     
     else:
         # Grid Search rapide
@@ -63,11 +73,12 @@ def main():
         }
         
         total = 3 * 3 * 2  # 18 configurations
+        n_workers = _num_workers(workers, total)
         print(f"\n⚠️  Cela va tester {total} configurations")
-        print(f"⏱️  Temps estimé: ~{total * episodes / 2000:.0f} minutes")
+        print(f"⏱️  Temps estimé: ~{total * episodes / 2000 / n_workers:.0f} minutes ({n_workers} processus)")
         
         if input("Continuer? (o/n): ").lower() == 'o':
-            result = tuner.grid_search(param_grid, episodes, eval_games)
+            result = tuner.grid_search(param_grid, episodes, eval_games, n_workers=n_workers)
     
     print("\n✅ AutoML terminé!")
     print(f"📊 Résultats détaillés dans: models/automl_results.csv")
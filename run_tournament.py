@@ -2,6 +2,7 @@
 Script pour lancer un tournoi entre modèles
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from rl_logic.tournament import Tournament
 from rl_logic.elo_system import ELOSystem
 from rl_logic.model_manager import ModelManager
@@ -49,12 +50,14 @@ def main():
     
     print(f"\n🎮 {len(selected_models)} modèles sélectionnés")
     
-    # Charger les agents
-    agents_dict = {}
-    for model_info in selected_models:
+    # Charger les agents (lectures disque en parallèle, ordre conservé)
+    def load_agent(model_info):
         agent = QLearningAgent()
         model_manager.load_model(agent, model_info['path'])
-        agents_dict[model_info['name']] = agent
+        return model_info['name'], agent
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        agents_dict = dict(executor.map(load_agent, selected_models))
     
     # Type de tournoi
     print("\nType de tournoi:")
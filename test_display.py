@@ -5,6 +5,22 @@ Test rapide pour vérifier l'affichage des métriques
 from rl_logic.model_manager import ModelManager
 from rl_logic.metrics import ModelMetrics
 
+# Métriques lues en priorité à la racine de l'entrée de list_models()
+_ROOT_KEYS = ('final_win_rate', 'final_draw_rate', 'final_loss_rate', 'total_episodes')
+_EXCLUDED = frozenset(_ROOT_KEYS)
+
+
+def _extract_model_data(model, metadata):
+    """Données attendues par compute_all_metrics pour une entrée de list_models()"""
+    merged = {key: model.get(key, metadata.get(key, 0)) for key in _ROOT_KEYS}
+    merged.update((k, v) for k, v in metadata.items() if k not in _EXCLUDED)
+    return {
+        'states': model.get('states', 0),
+        'epsilon': model.get('epsilon', 1.0),
+        'metadata': merged,
+        'timestamp': model.get('timestamp', '')
+    }
+
 print("=" * 70)
 print("TEST AFFICHAGE DES MÉTRIQUES")
 print("=" * 70 + "\n")
@@ -30,18 +46,7 @@ for i, model in enumerate(models[:5], 1):
     
     # Tester le calcul des métriques (comme dans l'interface)
     try:
-        model_data = {
-            'states': model.get('states', 0),
-            'epsilon': model.get('epsilon', 1.0),
-            'metadata': {
-                'final_win_rate': model.get('final_win_rate', metadata.get('final_win_rate', 0)),
-                'final_draw_rate': model.get('final_draw_rate', metadata.get('final_draw_rate', 0)),
-                'final_loss_rate': model.get('final_loss_rate', metadata.get('final_loss_rate', 0)),
-                'total_episodes': model.get('total_episodes', metadata.get('total_episodes', 0)),
-                **{k: v for k, v in metadata.items() if k not in ['final_win_rate', 'final_draw_rate', 'final_loss_rate', 'total_episodes']}
-            },
-            'timestamp': model.get('timestamp', '')
-        }
+        model_data = _extract_model_data(model, metadata)
         
         metrics = ModelMetrics.compute_all_metrics(model_data)
         
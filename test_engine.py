@@ -0,0 +1,81 @@
+"""
+Tests du moteur : tables précalculées et environnement vectorisé
+"""
+import itertools
+import numpy as np
+import pytest
+
+from engine.environment import TicTacToeEnvironment, BatchedTicTacToeEnv
+from engine.lookup_tables import (
+    ONGOING, WINNER_LUT, LEGAL_MASK_LUT, LEGAL_ACTIONS_LUT,
+    SYMMETRY_PERMS, SYMMETRY_ACTIONS, state_to_index, index_to_board,
+    symmetric_indices
+)
+
+LINES = [(0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6),
+         (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6)]
+
+
+def _brute_force_winner(board):
+    """Gagnant d'un plateau par parcours des 8 lignes (X prioritaire)"""
+    for player in (1, -1):
+        if any(all(board[i] == player for i in line) for line in LINES):
+            return player
+    return 0 if 0 not in board else ONGOING
+
+
+def test_lookup_tables_match_brute_force():
+    """WINNER_LUT, LEGAL_MASK_LUT et LEGAL_ACTIONS_LUT sur les 3^9 plateaux"""
+    for board in itertools.product((-1, 0, 1), repeat=9):
+        index = state_to_index(board)
+        assert index_to_board(index) == board
+        assert WINNER_LUT[index] == _brute_force_winner(board)
+        mask = sum(1 << i for i, cell in enumerate(board) if cell == 0)
+        assert LEGAL_MASK_LUT[index] == mask
+        assert LEGAL_ACTIONS_LUT[index] == tuple(i for i, cell in enumerate(board) if cell == 0)
+
+
+def test_symmetric_indices():
+    """Les 8 images d'un plateau sont ses rotations / miroirs, actions comprises"""
+    board = (1, -1, 0, 0, 1, 0, -1, 0, 0)
+    grid = np.array(board).reshape(3, 3)
+    expected = {state_to_index(np.rot90(g, k).ravel()) for g in (grid, grid.T) for k in range(4)}
+    images = symmetric_indices(state_to_index(board))
+    assert set(images.tolist()) == expected
+    for k, image in enumerate(images.tolist()):
+        image_board = index_to_board(image)
+        for action in range(9):
+            assert image_board[SYMMETRY_ACTIONS[k, action]] == board[action]
+    assert (np.sort(SYMMETRY_PERMS, axis=1) == np.arange(9)).all()
+    assert len(set(map(tuple, SYMMETRY_PERMS.tolist()))) == 8
+
+
+def test_batched_env_matches_single_env():
+    """BatchedTicTacToeEnv rejoue à l'identique des parties de TicTacToeEnvironment"""
+    rng = np.random.default_rng(0)
+    batch_size = 64
+    batched = BatchedTicTacToeEnv(batch_size)
+    envs = [TicTacToeEnvironment() for _ in range(batch_size)]
+
+    obs = batched.reset()
+    assert (obs == [env.state_index for env in envs]).all()
+    dones = np.zeros(batch_size, dtype=bool)
+    while not dones.all():
+        masks = batched.legal_masks()
+        actions = np.array([rng.choice(np.flatnonzero(mask)) if mask.any() else 0
+                            for mask in masks])
+        obs, rewards, dones = batched.step(actions)
+        for lane, env in enumerate(envs):
+            if not env.is_terminal():
+                _, reward, _ = env.apply_action(int(actions[lane]))
+                assert rewards[lane] == reward
+            assert obs[lane] == env.state_index
+            assert dones[lane] == env.is_terminal()
+
+    assert (batched.get_winners() == [env.get_winner() or 0 for env in envs]).all()
+
+    # Coup illégal dans une partie en cours
+    batched.reset()
+    batched.step(np.zeros(batch_size, dtype=np.int64))
+    with pytest.raises(ValueError):
+        batched.step(np.zeros(batch_size, dtype=np.int64))
@@ -0,0 +1,89 @@
+"""
+Tests des noyaux Numba : équivalence avec le Python pur et avec le chemin NumPy
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+import numpy as np
+import pytest
+
+from engine.lookup_tables import NUM_STATES, SYMMETRY_ACTIONS, symmetric_indices
+from rl_logic import kernels
+from rl_logic.agent import QLearningAgent
+from rl_logic.trainer import _play_eval_batch
+
+pytestmark = pytest.mark.skipif(not kernels.NUMBA_AVAILABLE, reason="numba non installé")
+
+# Entraîne 300 épisodes avec une graine fixe et sauvegarde Q-table et issues
+_TRAIN_SCRIPT = """
+import sys
+import numpy as np
+from rl_logic import kernels
+q_values = np.zeros((3 ** 9, 9), dtype=np.float32)
+q_visited = np.zeros(3 ** 9, dtype=np.uint8)
+kernels.seed_kernels(123)
+n = 300
+winners, moves = kernels.train_episodes(
+    q_values, q_visited, np.zeros(9, dtype=np.int8), np.linspace(1.0, 0.1, n),
+    np.arange(n) % 2 == 0, 0.2, 0.9, sys.argv[2] == "1")
+np.savez(sys.argv[1], q_values=q_values, q_visited=q_visited, winners=winners, moves=moves)
+"""
+
+
+def _train_in_subprocess(output: Path, symmetric: bool, disable_jit: bool) -> dict:
+    """Lance _TRAIN_SCRIPT dans un processus neuf (compilé ou Python pur)"""
+    env = dict(os.environ, NUMBA_DISABLE_JIT="1" if disable_jit else "0")
+    subprocess.run([sys.executable, "-c", _TRAIN_SCRIPT, str(output), "1" if symmetric else "0"],
+                   cwd=Path(__file__).parent, env=env, check=True)
+    with np.load(output) as data:
+        return {key: data[key] for key in data.files}
+
+
+@pytest.mark.parametrize("symmetric", [False, True])
+def test_play_episode_jit_matches_pure_python(tmp_path, symmetric):
+    """Même graine : mêmes parties et même Q-table, compilé ou non"""
+    compiled = _train_in_subprocess(tmp_path / "jit.npz", symmetric, disable_jit=False)
+    python = _train_in_subprocess(tmp_path / "py.npz", symmetric, disable_jit=True)
+
+    assert (compiled['winners'] == python['winners']).all()
+    assert (compiled['moves'] == python['moves']).all()
+    assert (compiled['q_visited'] == python['q_visited']).all()
+    # Seul l'arrondi float32 des calculs intermédiaires peut différer
+    np.testing.assert_allclose(compiled['q_values'], python['q_values'], rtol=0, atol=1e-6)
+
+
+def test_symmetric_updates_keep_q_invariant():
+    """Avec symmetric=True, les 8 images d'un couple (état, action) ont la même Q-valeur"""
+    q_values = np.zeros((NUM_STATES, 9), dtype=np.float32)
+    q_visited = np.zeros(NUM_STATES, dtype=np.uint8)
+    kernels.seed_kernels(0)
+    n = 500
+    kernels.train_episodes(q_values, q_visited, np.zeros(9, dtype=np.int8),
+                           np.full(n, 0.5), np.arange(n) % 2 == 0, 0.2, 0.9, True)
+
+    for index in np.flatnonzero(q_visited)[::50].tolist():
+        images = symmetric_indices(index)
+        assert q_visited[images].all()
+        for action in range(9):
+            values = q_values[images, SYMMETRY_ACTIONS[:, action]]
+            assert (values == values[0]).all()
+
+
+@pytest.mark.parametrize("epsilon", [0.0, 0.3])
+def test_batched_eval_matches_numpy_batch(epsilon):
+    """batched_eval (Numba) et _play_eval_batch (NumPy) : résultats identiques"""
+    agent = QLearningAgent(oracle_init=True)
+    rng = np.random.default_rng(0)
+    agent.q_values += rng.normal(0, 0.01, agent.q_values.shape).astype(np.float32)
+    agent.q_values[::7] = 0  # Égalités départagées par les tirages
+    policy = agent.get_policy_table()
+    uniforms = np.random.default_rng(42).random((1000, kernels.EVAL_UNIFORMS_PER_GAME))
+
+    numba_winners, numba_moves = kernels.batched_eval(agent.q_values, policy, epsilon,
+                                                      uniforms, 1000)
+    numpy_winners, numpy_moves = _play_eval_batch(agent.q_values, policy, epsilon, uniforms)
+
+    assert (numba_winners == numpy_winners).all()
+    assert (numba_moves == numpy_moves).all()
+    assert ((numba_moves >= 5) & (numba_moves <= 9)).all()
@@ -2,13 +2,14 @@
 Script de test pour vérifier le calcul des métriques
 """
 
-import pickle
 from pathlib import Path
 from rl_logic.metrics import ModelMetrics
+from rl_logic.model_manager import ModelManager
 
 # Charger un modèle récent
 models_dir = Path("models")
-model_files = list(models_dir.glob("model_*ep_*.pkl"))
+model_files = [path for path in models_dir.glob("model_*ep_*")
+               if path.suffix in ModelManager.MODEL_SUFFIXES]
 
 if not model_files:
     print("❌ Aucun modèle trouvé")
@@ -18,9 +19,8 @@ if not model_files:
 latest_model = max(model_files, key=lambda p: p.stat().st_mtime)
 print(f"📊 Test du modèle: {latest_model.name}\n")
 
-# Charger le modèle
-with open(latest_model, 'rb') as f:
-    model_data = pickle.load(f)
+# Charger les infos du modèle (fichier .meta.json, sans la Q-table)
+model_data = ModelManager.load_model_info(latest_model)
 
 print("=== Contenu du modèle ===")
 print(f"Clés: {model_data.keys()}\n")
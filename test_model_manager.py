@@ -0,0 +1,116 @@
+"""
+Tests de la persistance des modèles : .npz (+ .meta.json) et anciens .pkl
+"""
+import pickle
+from datetime import datetime
+import numpy as np
+import pytest
+
+from rl_logic.agent import QLearningAgent
+from rl_logic.model_manager import ModelManager
+
+
+def _trained_agent() -> QLearningAgent:
+    """Agent aux hyperparamètres non standards et à la Q-table remplie"""
+    return QLearningAgent(alpha=0.3, gamma=0.8, epsilon=0.4, epsilon_min=0.02,
+                          epsilon_decay=0.99, symmetric=True, oracle_init=True)
+
+
+def _assert_same_agent(loaded: QLearningAgent, agent: QLearningAgent):
+    """Même Q-table et mêmes hyperparamètres"""
+    assert np.array_equal(loaded.q_values, agent.q_values)
+    assert np.array_equal(loaded.q_visited, agent.q_visited)
+    for name in ('alpha', 'gamma', 'epsilon', 'epsilon_start', 'epsilon_min', 'epsilon_decay'):
+        assert getattr(loaded, name) == getattr(agent, name)
+
+
+def test_npz_round_trip(tmp_path):
+    """save_model puis load_model restaure Q-table, hyperparamètres et métadonnées"""
+    manager = ModelManager(str(tmp_path))
+    agent = _trained_agent()
+    filepath = manager.save_model(agent, "model", metadata={'final_win_rate': 91.5})
+
+    loaded = QLearningAgent()
+    assert manager.load_model(loaded, filepath)
+    _assert_same_agent(loaded, agent)
+    assert loaded.symmetric
+
+    info = ModelManager.load_model_info(filepath)
+    assert info['metadata']['final_win_rate'] == 91.5
+    assert info['stats']['total_states'] == agent.states_learned
+    assert manager.model_files() == [tmp_path / "model.npz"]
+
+
+def test_npz_loads_without_sidecar(tmp_path):
+    """Un .npz copié sans son .meta.json reste chargeable (infos intégrées)"""
+    manager = ModelManager(str(tmp_path))
+    agent = _trained_agent()
+    filepath = manager.save_model(agent, "bare")
+    ModelManager.info_path(filepath).unlink()
+
+    loaded = QLearningAgent()
+    assert manager.load_model(loaded, filepath)
+    _assert_same_agent(loaded, agent)
+    assert ModelManager.load_model_info(filepath)['hyperparameters']['alpha'] == 0.3
+
+    # Ancien .npz sans infos intégrées : hyperparamètres de l'agent conservés
+    np.savez_compressed(tmp_path / "old.npz", q_values=agent.q_values, q_visited=agent.q_visited)
+    loaded = QLearningAgent(alpha=0.7)
+    assert manager.load_model(loaded, str(tmp_path / "old.npz"))
+    assert np.array_equal(loaded.q_values, agent.q_values)
+    assert loaded.alpha == 0.7
+    with pytest.raises(FileNotFoundError):
+        ModelManager.load_model_info(tmp_path / "old.npz")
+
+    assert not manager.load_model(QLearningAgent(), str(tmp_path / "missing.npz"))
+
+
+def test_legacy_pkl_round_trip(tmp_path):
+    """Les modèles .pkl (dictionnaire picklé) restent lisibles"""
+    manager = ModelManager(str(tmp_path))
+    agent = _trained_agent()
+    # Format d'origine de save_model
+    model_data = {
+        'q_table': agent.get_q_table_copy(),
+        'hyperparameters': {
+            'alpha': agent.alpha,
+            'gamma': agent.gamma,
+            'epsilon': agent.epsilon,
+            'epsilon_start': agent.epsilon_start,
+            'epsilon_min': agent.epsilon_min,
+            'epsilon_decay': agent.epsilon_decay
+        },
+        'stats': agent.get_stats(),
+        'timestamp': datetime.now().isoformat(),
+        'metadata': {'total_episodes': 5000}
+    }
+    with open(tmp_path / "legacy.pkl", 'wb') as f:
+        pickle.dump(model_data, f)
+
+    loaded = QLearningAgent()
+    assert manager.load_model(loaded, str(tmp_path / "legacy.pkl"))
+    _assert_same_agent(loaded, agent)
+    assert not loaded.symmetric  # Absent des anciens modèles
+
+    q_values, q_visited = ModelManager.load_q(tmp_path / "legacy.pkl")
+    assert np.array_equal(q_values, agent.q_values)
+    assert np.array_equal(q_visited, agent.q_visited)
+    info = ModelManager.load_model_info(tmp_path / "legacy.pkl")
+    assert 'q_table' not in info
+    assert info['metadata']['total_episodes'] == 5000
+
+    # Le modèle par défaut .npz absent : repli sur l'ancien q_table.pkl
+    (tmp_path / "legacy.pkl").rename(tmp_path / "q_table.pkl")
+    loaded = QLearningAgent()
+    assert manager.load_model(loaded)
+    _assert_same_agent(loaded, agent)
+
+
+def test_failed_sidecar_write_raises(tmp_path):
+    """save_model ne signale jamais un succès si le .meta.json n'a pas pu être écrit"""
+    manager = ModelManager(str(tmp_path))
+    (tmp_path / "blocked.meta.json").mkdir()  # Cible impossible à remplacer
+
+    with pytest.raises(OSError):
+        manager.save_model(QLearningAgent(), "blocked")
+    assert not (tmp_path / "blocked.meta.json.tmp").exists()
@@ -53,7 +53,7 @@ def test_sort_logic():
         success = manager.load_model(agent, best_path)
         if success:
             print("✅ Chargé avec succès!")
-            print(f"   États: {len(agent.q_table)}")
+            print(f"   États: {agent.states_learned}")
             print(f"   Epsilon: {agent.epsilon:.6f}")
             print(f"   Gamma: {agent.gamma}")
         else:
@@ -0,0 +1,64 @@
+"""
+Tests de l'entraînement : workers parallèles, oracle et statistiques d'évaluation
+"""
+import numpy as np
+import pytest
+
+from engine.environment import TicTacToeEnvironment
+from rl_logic import kernels
+from rl_logic.agent import QLearningAgent
+from rl_logic.logger import RLLogger
+from rl_logic.model_manager import ModelManager
+from rl_logic.trainer import Trainer, OnlineStats
+
+
+def _trainer(agent, tmp_path):
+    """Trainer dont les logs et modèles vont dans tmp_path"""
+    return Trainer(agent, TicTacToeEnvironment(),
+                   RLLogger(logs_dir=str(tmp_path / "logs")),
+                   ModelManager(models_dir=str(tmp_path / "models")))
+
+
+@pytest.mark.skipif(not kernels.NUMBA_AVAILABLE, reason="numba non installé")
+def test_parallel_training_fills_q_table(tmp_path):
+    """train(num_workers=2) joue tous les épisodes et remplit la Q-table"""
+    agent = QLearningAgent(epsilon=1.0, epsilon_decay=0.999)
+    trainer = _trainer(agent, tmp_path)
+
+    stats = trainer.train(2000, verbose=False, eval_games=100, eval_seeds=1,
+                          num_workers=2, sync_interval=500)
+
+    assert trainer.wins + trainer.losses + trainer.draws == 2000
+    assert len(trainer.episode_lengths) == 2000
+    assert agent.states_learned > 1000
+    assert np.count_nonzero(agent.q_values) > 0
+    assert agent.epsilon == pytest.approx(max(agent.epsilon_min, 0.999 ** 2000))
+    assert stats['win_rate'] + stats['loss_rate'] + stats['draw_rate'] == pytest.approx(100)
+    assert (tmp_path / "models" / "q_table.npz").exists()
+
+
+def test_oracle_agent_never_loses(tmp_path):
+    """La Q-table de l'oracle minimax ne perd aucune partie contre l'aléatoire"""
+    trainer = _trainer(QLearningAgent(oracle_init=True), tmp_path)
+
+    results = trainer.evaluate(1000, verbose=False, num_seeds=2)
+
+    assert results['losses'] == 0
+    assert results['win_rate'] > 80
+
+
+def test_online_stats_matches_numpy():
+    """OnlineStats (Welford) : mêmes moyenne, écart-type, min et max que NumPy"""
+    values = np.random.default_rng(0).random(50) * 100
+    stats = OnlineStats()
+    for value in values.tolist():
+        stats.push(value)
+
+    assert stats.n == 50
+    assert stats.mean == pytest.approx(values.mean())
+    assert stats.std == pytest.approx(values.std())
+    assert (stats.mn, stats.mx) == (values.min(), values.max())
+
+    single = OnlineStats()
+    single.push(42.0)
+    assert single.std == 0.0